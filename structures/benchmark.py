@@ -0,0 +1,199 @@
+"""Benchmarks of Matrix and Vector operations.
+Every operation is measured for every size with timeit (operations per second, best of repeats) and tracemalloc (peak memory of one call).
+Results can be saved to JSON file and compared against saved baseline to prove or rule out regressions:
+    python benchmark.py --save baseline.json
+    python benchmark.py --compare baseline.json
+Speedup of parallel operations (products, eliminations, LU decomposition) is measured against serial baseline:
+    python benchmark.py --workers 4 --compare baseline.json"""
+import sys
+import json
+import platform
+import tracemalloc
+from timeit import Timer
+from random import Random
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+
+from matrix import Matrix, numpy
+from vector import Vector
+
+# Matrix sizes (and vector lengths) benchmarked by default.
+BENCHMARK_SIZES = (4, 8, 16, 32, 64, 128, 256, 512)
+# Seed of random generator of benchmark inputs (same inputs on every run).
+BENCHMARK_SEED = 1
+# Minimal total time of one timing repeat in seconds.
+BENCHMARK_MIN_TIME = 0.2
+# Relative drop of operations per second considered as regression.
+BENCHMARK_TOLERANCE = 0.1
+
+def _random_matrix(rnd: Random, size: int) -> Matrix:
+    """[INTERNAL] get random square matrix with dominant diagonal (it's never singular)."""
+    m = Matrix(size, size)
+    for i in range(size):
+        row = m[i]
+        for j in range(size):
+            row[j] = rnd.uniform(-1.0, 1.0)
+        row[i] += size
+    return m
+
+def _random_vector(rnd: Random, size: int) -> Vector:
+    """[INTERNAL] get random vector of given length."""
+    return Vector([rnd.uniform(-1.0, 1.0) for i in range(size)])
+
+def _matrix_mul(rnd: Random, size: int):
+    """[INTERNAL] benchmark of product of two matrices."""
+    m1 = _random_matrix(rnd, size)
+    m2 = _random_matrix(rnd, size)
+    return lambda: m1 * m2
+
+def _matrix_determinant(rnd: Random, size: int):
+    """[INTERNAL] benchmark of determinant of matrix (of its copy, so decomposition cached by matrix is not reused)."""
+    m = _random_matrix(rnd, size)
+    return lambda: Matrix.determinant(m.copy())
+
+def _matrix_gauss(rnd: Random, size: int):
+    """[INTERNAL] benchmark of solution of linear system with Gauss method."""
+    m = _random_matrix(rnd, size)
+    v = _random_vector(rnd, size)
+    return lambda: Matrix.gauss(m, v)
+
+def _matrix_inverse(rnd: Random, size: int):
+    """[INTERNAL] benchmark of inversed matrix (of its copy, so inversed matrix cached by matrix is not reused)."""
+    m = _random_matrix(rnd, size)
+    return lambda: m.copy().inversed()
+
+def _matrix_lower_triangle(rnd: Random, size: int):
+    """[INTERNAL] benchmark of elimination of elements below main diagonal (of matrix copy)."""
+    m = _random_matrix(rnd, size)
+    return lambda: m.copy().to_lower_triangle()
+
+def _matrix_transpose(rnd: Random, size: int):
+    """[INTERNAL] benchmark of transposed matrix."""
+    m = _random_matrix(rnd, size)
+    return lambda: m.transposed()
+
+def _vector_add(rnd: Random, size: int):
+    """[INTERNAL] benchmark of sum of two vectors."""
+    v1 = _random_vector(rnd, size)
+    v2 = _random_vector(rnd, size)
+    return lambda: v1 + v2
+
+def _vector_mul(rnd: Random, size: int):
+    """[INTERNAL] benchmark of vector multiplied by number."""
+    v = _random_vector(rnd, size)
+    return lambda: v * 2.5
+
+def _vector_dot(rnd: Random, size: int):
+    """[INTERNAL] benchmark of dot product of two vectors."""
+    v1 = _random_vector(rnd, size)
+    v2 = _random_vector(rnd, size)
+    return lambda: v1.dot_product(v2)
+
+def _vector_length(rnd: Random, size: int):
+    """[INTERNAL] benchmark of vector length."""
+    v = _random_vector(rnd, size)
+    return lambda: v.length()
+
+# Benchmarked operations: name - function making callable of the operation for given random generator and size.
+BENCHMARKS = {
+    "matrix.mul": _matrix_mul,
+    "matrix.determinant": _matrix_determinant,
+    "matrix.gauss": _matrix_gauss,
+    "matrix.inverse": _matrix_inverse,
+    "matrix.lower_triangle": _matrix_lower_triangle,
+    "matrix.transpose": _matrix_transpose,
+    "vector.add": _vector_add,
+    "vector.mul": _vector_mul,
+    "vector.dot": _vector_dot,
+    "vector.length": _vector_length,
+}
+
+def measure(func, repeat: int=5) -> dict:
+    """Measure given callable: returns dict with `ops_per_sec` (best of `repeat` timings) and `peak_bytes` (peak memory allocated by one call)."""
+    timer = Timer(func)
+    number, elapsed = timer.autorange()
+    number = max(1, int(number * BENCHMARK_MIN_TIME / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        func()
+        peak = tracemalloc.get_traced_memory()[1] - start
+    finally:
+        tracemalloc.stop()
+    return {"ops_per_sec": number / best, "peak_bytes": peak}
+
+def run(names=None, sizes=BENCHMARK_SIZES, repeat: int=5, log=None) -> dict:
+    """Run benchmarks and return their results: {"name/size": {"ops_per_sec": float, "peak_bytes": int}}.
+    [names] - names of benchmarked operations (keys of BENCHMARKS), all by default;
+    [sizes] - matrix sizes (vector lengths);
+    [repeat] - count of timing repeats;
+    [log] - function called with key and result of every finished benchmark."""
+    results = {}
+    for name in (names or BENCHMARKS):
+        for size in sizes:
+            key = "{0}/{1}".format(name, size)
+            results[key] = measure(BENCHMARKS[name](Random(BENCHMARK_SEED), size), repeat)
+            if (log is not None):
+                log(key, results[key])
+    return results
+
+def environment(workers: int=0) -> dict:
+    """Get description of environment results are measured in. [workers] - count of processes parallel operations are run in (0 - serially)."""
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "machine": platform.machine(), "numpy": numpy.__version__ if numpy is not None else None, "workers": workers}
+
+def compare(results: dict, baseline: dict, tolerance: float=BENCHMARK_TOLERANCE) -> list:
+    """Compare results with baseline results (both as returned by `run`).
+    Returns list of (key, baseline ops/sec, ops/sec, ratio, baseline peak bytes, peak bytes, regressed) for keys present in both,
+    operation is regressed if its ops/sec dropped by more than `tolerance` (relative)."""
+    out = []
+    for key, result in results.items():
+        if (key in baseline):
+            old = baseline[key]
+            ratio = result["ops_per_sec"] / old["ops_per_sec"]
+            out.append((key, old["ops_per_sec"], result["ops_per_sec"], ratio, old["peak_bytes"], result["peak_bytes"], ratio < 1.0 - tolerance))
+    return out
+
+def main(argv=None) -> int:
+    """Run benchmarks from command line. Returns exit code: 1 if any operation regressed against baseline, otherwise 0."""
+    parser = ArgumentParser(description="Benchmarks of Matrix and Vector operations.")
+    parser.add_argument("-b", "--benchmark", action="append", choices=list(BENCHMARKS), help="benchmarked operation (can be repeated), all by default")
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=list(BENCHMARK_SIZES), help="matrix sizes (vector lengths)")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="count of timing repeats")
+    parser.add_argument("--save", metavar="FILE", help="save results to JSON file")
+    parser.add_argument("--compare", metavar="FILE", help="compare results with baseline JSON file")
+    parser.add_argument("-w", "--workers", type=int, default=0, help="run parallel operations in process pool of this size (see Matrix.set_executor), 0 - serially")
+    parser.add_argument("--tolerance", type=float, default=BENCHMARK_TOLERANCE, help="relative drop of ops/sec considered as regression")
+    args = parser.parse_args(argv)
+    baseline = None
+    if (args.compare):
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    log = lambda key, result: print("{0:<28} {1:>14.1f} ops/s {2:>12} B".format(key, result["ops_per_sec"], result["peak_bytes"]))
+    executor = ProcessPoolExecutor(args.workers) if args.workers else None
+    Matrix.set_executor(executor, args.workers)
+    try:
+        results = run(args.benchmark, args.sizes, args.repeat, log)
+    finally:
+        Matrix.set_executor(None)
+        if (executor is not None):
+            executor.shutdown()
+    if (args.save):
+        with open(args.save, "w") as f:
+            json.dump({"environment": environment(args.workers), "results": results}, f, indent=2)
+    if (baseline is None):
+        return 0
+    if (baseline["environment"] != environment(args.workers)):
+        print("Warning: baseline was measured in different environment: {0}".format(baseline["environment"]))
+    regressed = 0
+    print()
+    print("{0:<28} {1:>14} {2:>14} {3:>7} {4:>12} {5:>12}".format("operation", "baseline ops/s", "ops/s", "ratio", "baseline B", "peak B"))
+    for key, old, new, ratio, old_peak, peak, slower in compare(results, baseline["results"], args.tolerance):
+        print("{0:<28} {1:>14.1f} {2:>14.1f} {3:>6.2f}x {4:>12} {5:>12}{6}".format(key, old, new, ratio, old_peak, peak, "  REGRESSED" if slower else ""))
+        regressed += slower
+    print("{0} of compared operations regressed.".format(regressed))
+    return 1 if regressed else 0
+
+if (__name__ == "__main__"):
+    sys.exit(main())
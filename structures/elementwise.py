@@ -0,0 +1,71 @@
+from array import array
+from itertools import repeat
+from operator import add, sub, mul, neg
+from numbers import Real
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Element-wise operations over float buffers of at least this length are performed with NumPy when it's available.
+NUMPY_MIN_LENGTH = 1024
+
+# NumPy versions of operators (used only for float buffers).
+_UFUNCS = {add: numpy.add, sub: numpy.subtract, mul: numpy.multiply, neg: numpy.negative} if numpy is not None else {}
+
+def _is_buffer(values) -> bool:
+    """[INTERNAL] whether given values are flat buffer of floats (Matrix storage or its row)."""
+    return isinstance(values, (array, memoryview))
+
+def _ufunc(func, values):
+    """[INTERNAL] get NumPy version of `func` if it can be used for given values, otherwise None."""
+    if (numpy is None or not _is_buffer(values) or len(values) < NUMPY_MIN_LENGTH):
+        return None
+    if (isinstance(func, numpy.ufunc)):
+        return func
+    return _UFUNCS.get(func)
+
+def _result(values, result, out):
+    """[INTERNAL] write `result` list to `out` and return it, or return `result` as array if `values` are buffer, otherwise as list."""
+    if (out is not None):
+        out[:] = result if isinstance(out, list) else array("d", result)
+        return out
+    return array("d", result) if _is_buffer(values) else result
+
+def apply(func, values, out=None):
+    """Apply `func` to every element of `values`.
+    `func` - function of one argument (operators and NumPy ufuncs are performed with NumPy on big float buffers);
+    `values` - sequence of numbers;
+    [out] - sequence of same length to write results to, can be `values` itself.
+    Returns `out` if it's given, otherwise array of floats if `values` is float buffer (array or memoryview), otherwise list."""
+    ufunc = _ufunc(func, values)
+    if (ufunc is not None):
+        if (out is None):
+            out = array("d", [0.0]) * len(values)
+        if (not _is_buffer(out)):
+            out[:] = ufunc(numpy.frombuffer(values)).tolist()
+        else:
+            ufunc(numpy.frombuffer(values), out=numpy.frombuffer(out))
+        return out
+    return _result(values, list(map(func, values)), out)
+
+def combine(func, a, b, out=None):
+    """Combine elements of `a` with elements of `b` (or with `b` itself if it's a number) by `func`.
+    `func` - function of two arguments (operators and NumPy ufuncs are performed with NumPy on big float buffers);
+    `a` - sequence of numbers;
+    `b` - sequence of numbers of same length as `a` or number;
+    [out] - sequence of same length to write results to, can be `a` or `b`.
+    Returns `out` if it's given, otherwise array of floats if `a` is float buffer (array or memoryview), otherwise list."""
+    scalar = isinstance(b, Real)
+    ufunc = _ufunc(func, a)
+    if (ufunc is not None and (scalar or _is_buffer(b))):
+        other = b if scalar else numpy.frombuffer(b)
+        if (out is None):
+            out = array("d", [0.0]) * len(a)
+        if (not _is_buffer(out)):
+            out[:] = ufunc(numpy.frombuffer(a), other).tolist()
+        else:
+            ufunc(numpy.frombuffer(a), other, out=numpy.frombuffer(out))
+        return out
+    return _result(a, list(map(func, a, repeat(b) if scalar else b)), out)
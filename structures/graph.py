@@ -1,14 +1,207 @@
-from matrix import Matrix
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+from math import inf
+from operator import add
+from itertools import repeat
+
+import parallel
+from matrix import Matrix, numpy
+
+# Shortest paths between all pairs of vertices of sparse graph are found in processes of executor set by `Matrix.set_executor` if graph has more than this count of vertices.
+PARALLEL_MIN_VERTICES = 256
+# Floyd-Warshall algorithm is run with NumPy when it's available and graph has at least this count of vertices.
+NUMPY_MIN_VERTICES = 64
+
+class _MatrixEdges():
+    """[INTERNAL] edges of graph stored in adjacency Matrix: element (i, j) is weight of edge from i-th to j-th vertex, 0.0 - no edge. Memory is O(V^2)."""
+    def __init__(self):
+        self.matrix = Matrix(0, 0)
+        
+    def append(self, count: int=1):
+        """Add `count` vertices without edges."""
+        self.matrix.resize(self.matrix.rows + count, self.matrix.columns + count)
+        
+    def remove(self, i: int):
+        """Remove `i`-th vertex and its edges."""
+        self.matrix.remove_row(i)
+        try:
+            self.matrix.remove_column(i)
+        except RuntimeError:
+            pass
+        
+    def get(self, i: int, j: int) -> float:
+        """Get weight of edge from `i`-th to `j`-th vertex (0.0 - no edge)."""
+        return self.matrix._data[i * self.matrix.columns + j]
+    
+    def set(self, i: int, j: int, weight: float):
+        """Set weight of edge from `i`-th to `j`-th vertex (0.0 - remove edge)."""
+        self.matrix[i][j] = weight
+    
+    def set_many(self, sources: array, targets: array, weights: array):
+        """Set weights of edges from `sources[k]`-th to `targets[k]`-th vertices."""
+        data = self.matrix._data
+        columns = self.matrix.columns
+        for i, j, w in zip(sources, targets, weights):
+            data[i * columns + j] = w
+        self.matrix.changed()
+        
+    def neighbors(self, i: int):
+        """Iterate (index, weight) of vertices connected from `i`-th vertex."""
+        columns = self.matrix.columns
+        return ((j, w) for j, w in enumerate(self.matrix._data[i * columns:(i + 1) * columns]) if w != 0.0)
+    
+    def edges(self):
+        """Iterate (i, j, weight) of all edges."""
+        for i in range(self.matrix.rows):
+            for j, w in self.neighbors(i):
+                yield i, j, w
+                
+class _DictEdges():
+    """[INTERNAL] edges of graph stored in adjacency dicts: i-th dict maps indices of vertices connected from i-th vertex to weights. Memory is O(V + E)."""
+    def __init__(self):
+        self.adjacency = []
+        
+    def append(self, count: int=1):
+        """Add `count` vertices without edges."""
+        self.adjacency.extend({} for k in range(count))
+        
+    def remove(self, i: int):
+        """Remove `i`-th vertex and its edges (indices of next vertices are shifted)."""
+        self.adjacency.pop(i)
+        for k, targets in enumerate(self.adjacency):
+            if (targets and (i in targets or max(targets) > i)):
+                self.adjacency[k] = {(j - 1 if j > i else j): w for j, w in targets.items() if j != i}
+                
+    def get(self, i: int, j: int) -> float:
+        """Get weight of edge from `i`-th to `j`-th vertex (0.0 - no edge)."""
+        return self.adjacency[i].get(j, 0.0)
+    
+    def set(self, i: int, j: int, weight: float):
+        """Set weight of edge from `i`-th to `j`-th vertex (0.0 - remove edge)."""
+        if (weight != 0.0):
+            self.adjacency[i][j] = weight
+        else:
+            self.adjacency[i].pop(j, None)
+    
+    def set_many(self, sources: array, targets: array, weights: array):
+        """Set weights of edges from `sources[k]`-th to `targets[k]`-th vertices."""
+        adjacency = self.adjacency
+        for i, j, w in zip(sources, targets, weights):
+            adjacency[i][j] = w
+            
+    def neighbors(self, i: int):
+        """Iterate (index, weight) of vertices connected from `i`-th vertex."""
+        return self.adjacency[i].items()
+    
+    def edges(self):
+        """Iterate (i, j, weight) of all edges."""
+        for i, targets in enumerate(self.adjacency):
+            for j, w in targets.items():
+                yield i, j, w
+
+class ShortestPaths():
+    """Shortest paths from source vertex found by search in graph (see `Graph.bfs`, `Graph.dijkstra` and `Graph.astar`), valid until graph is changed.
+    If search had target vertex it stopped when target was reached, so only path to target (and to vertices on it) is surely shortest."""
+    def __init__(self, graph, source: int, distances: array, previous: array):
+        """[INTERNAL] `source` - index of source vertex, `distances` - distances of vertices by index (inf - not reached), `previous` - indices of previous vertices on paths (-1 - none)."""
+        self._graph = graph
+        self._source = source
+        self._distances = distances
+        self._previous = previous
+    
+    @property
+    def source(self):
+        """Get source vertex."""
+        return self._graph._vertices[self._source]
+    
+    def _find(self, vertex) -> int:
+        """[INTERNAL] get index of vertex, raise ValueError if it's not in graph."""
+        idx = self._graph.find(vertex)
+        if (idx == -1):
+            raise ValueError("Given vertex is not in graph!")
+        return idx
+    
+    def distance(self, vertex) -> float:
+        """Get length of path from source to given vertex, inf if vertex is not reachable. Raises ValueError if vertex is not in graph."""
+        return self._distances[self._find(vertex)]
+    
+    def reachable(self, vertex) -> bool:
+        """Whether path from source to given vertex was found. Raises ValueError if vertex is not in graph."""
+        return self._distances[self._find(vertex)] != inf
+    
+    def path(self, vertex) -> list:
+        """Get vertices on path from source to given vertex (both included), empty list if vertex is not reachable. Raises ValueError if vertex is not in graph."""
+        idx = self._find(vertex)
+        if (self._distances[idx] == inf):
+            return []
+        out = []
+        while (idx != -1):
+            out.append(self._graph._vertices[idx])
+            idx = self._previous[idx]
+        out.reverse()
+        return out
+                
+class AllPairsShortestPaths():
+    """Shortest paths between all pairs of vertices (see `Graph.all_pairs`), valid until graph is changed.
+    Stored in two flat V x V arrays: distances (floats) and next hops (32-bit indices of next vertices on paths), so memory is 12 * V^2 bytes."""
+    def __init__(self, graph, distances: array, hops: array):
+        """[INTERNAL] `distances` - distance from i-th to j-th vertex at (i * V + j) pos (inf - no path), `hops` - index of vertex after i-th on path to j-th (-1 - no path or i == j)."""
+        self._graph = graph
+        self._distances = distances
+        self._hops = hops
+    
+    def _find(self, vtx1, vtx2) -> tuple:
+        """[INTERNAL] get indices of given vertices, raise ValueError if any of them is not in graph."""
+        idx1 = self._graph.find(vtx1)
+        idx2 = self._graph.find(vtx2)
+        if (idx1 == -1):
+            raise ValueError("Given vertex 1 is not in graph!")
+        if (idx2 == -1):
+            raise ValueError("Given vertex 2 is not in graph!")
+        return idx1, idx2
+    
+    def distance(self, vtx1, vtx2) -> float:
+        """Get length of shortest path from `vtx1` to `vtx2` vertex, inf if there is no path. Raises ValueError if any vertex is not in graph."""
+        idx1, idx2 = self._find(vtx1, vtx2)
+        return self._distances[idx1 * len(self._graph._vertices) + idx2]
+    
+    def next_hop(self, vtx1, vtx2):
+        """Get vertex after `vtx1` on shortest path from `vtx1` to `vtx2`, None if there is no path or vertices are same. Raises ValueError if any vertex is not in graph."""
+        idx1, idx2 = self._find(vtx1, vtx2)
+        hop = self._hops[idx1 * len(self._graph._vertices) + idx2]
+        return None if hop == -1 else self._graph._vertices[hop]
+    
+    def path(self, vtx1, vtx2) -> list:
+        """Get vertices on shortest path from `vtx1` to `vtx2` (both included), empty list if there is no path. Raises ValueError if any vertex is not in graph."""
+        idx1, idx2 = self._find(vtx1, vtx2)
+        n = len(self._graph._vertices)
+        if (self._distances[idx1 * n + idx2] == inf):
+            return []
+        out = [self._graph._vertices[idx1]]
+        while (idx1 != idx2):
+            idx1 = self._hops[idx1 * n + idx2]
+            out.append(self._graph._vertices[idx1])
+        return out
 
 class Graph():
     """A graph structure."""
-    def __init__(self):
-        """Create a new Graph object."""
+    def __init__(self, sparse: bool=False):
+        """Create a new Graph object.
+        [sparse] - False - store edges in adjacency matrix (memory O(V^2)), True - in adjacency dicts (memory O(V + E), for sparse graphs)."""
         self._vertices = []
-        self._edges = Matrix(0, 0)
+        self._index = {}
+        self._unhashable = 0
+        self._edges = _DictEdges() if sparse else _MatrixEdges()
         self._oriented = False
         self._weighted = False
+        self._all_pairs = None
         
+    @property
+    def sparse(self) -> bool:
+        """Get whether edges of this graph are stored in adjacency dicts (True) or in adjacency matrix (False)."""
+        return isinstance(self._edges, _DictEdges)
+    
     @property
     def oriented(self):
         return self._oriented
@@ -20,13 +213,11 @@ class Graph():
         value = bool(value)
         if (self._oriented != value):
             self._oriented = value
+            self._all_pairs = None
             if (not self._oriented):
-                for i in range(self._edges.rows):
-                    for j in range(i + 1, self._edges.columns):
-                        if (self._edges[i][j] != 0.0):
-                            self._edges[j][i] = self._edges[i][j]
-                        elif (self._edges[j][i] != 0.0):
-                            self._edges[i][j] = self._edges[j][i]
+                for i, j, w in list(self._edges.edges()):
+                    if (i < j or self._edges.get(j, i) == 0.0):
+                        self._edges.set(j, i, w)
                         
     @property
     def weighted(self):
@@ -39,11 +230,10 @@ class Graph():
         value = bool(value)
         if (self._weighted != value):
             self._weighted = value
+            self._all_pairs = None
             if (not self._weighted):
-                for i in range(self._edges.rows):
-                    for j in range(self._edges.columns):
-                        if (self._edges[i][j] != 0.0):
-                            self._edges[i][j] = 1.0
+                for i, j, w in list(self._edges.edges()):
+                    self._edges.set(i, j, 1.0)
                             
     def __len__(self):
         """Get count of vertices."""
@@ -55,28 +245,49 @@ class Graph():
         
     def append(self, vertex):
         """Add given vertex to graph."""
+        self._index_vertex(vertex, len(self._vertices))
         self._vertices.append(vertex)
-        self._edges.resize(self._edges.rows + 1, self._edges.columns + 1)
+        self._edges.append()
+        self._all_pairs = None
         
     def remove(self, vertex):
         """Remove first occurrence of given vertex. Raises ValueError if vertex is not found."""
         idx = self.find(vertex)
         if (idx != -1):
             self._vertices.pop(idx)
-            self._edges.remove_row(idx)
-            try:
-                self._edges.remove_column(idx)
-            except RuntimeError:
-                pass
+            self._edges.remove(idx)
+            self._reindex()
+            self._all_pairs = None
         else:
             raise ValueError("Given vertex is not in graph!")
         
     def find(self, vertex):
-        """Get lowest index of given vertex. Returns -1 if not found."""
+        """Get lowest index of given vertex. Returns -1 if not found.
+        Hashable vertices are found in index in O(1), unhashable are searched by scan of all vertices."""
+        try:
+            idx = self._index.get(vertex, -1)
+            if (not self._unhashable):
+                return idx
+        except TypeError:
+            pass
         try:
             return self._vertices.index(vertex)
         except ValueError:
             return -1
+    
+    def _index_vertex(self, vertex, idx: int):
+        """[INTERNAL] add vertex at `idx` pos to index (if it's not there with lower index)."""
+        try:
+            self._index.setdefault(vertex, idx)
+        except TypeError:
+            self._unhashable += 1
+    
+    def _reindex(self):
+        """[INTERNAL] rebuild index of vertices after their positions changed."""
+        self._index = {}
+        self._unhashable = 0
+        for idx, vertex in enumerate(self._vertices):
+            self._index_vertex(vertex, idx)
         
     def connect(self, vtx1, vtx2, weight: float=1.0):
         """Connect given vertices with given weight.
@@ -85,11 +296,7 @@ class Graph():
         - given weight is <= 0.0;
         - given vertices are same;
         - one of given vertices is not found."""
-        if (weight != 1.0):
-            if (not self._weighted):
-                raise ValueError("Cannot set weight while graph is not weighted, consider changing property `weighted` before!")
-            if (weight <= 0.0):
-                raise ValueError("Weight cannot be <= 0.0!")
+        self._check_weight(weight)
         if (vtx1 == vtx2):
             raise ValueError("Cannot connect vertex to itself!")
         idx1 = self.find(vtx1)
@@ -98,9 +305,105 @@ class Graph():
             raise ValueError("Given vertex 1 is not in graph!")
         if (idx2 == -1):
             raise ValueError("Given vertex 2 is not in graph!")        
-        self._edges[idx1][idx2] = weight
+        self._edges.set(idx1, idx2, weight)
         if (not self._oriented):
-            self._edges[idx2][idx1] = weight
+            self._edges.set(idx2, idx1, weight)
+        self._all_pairs = None
+    
+    def _check_weight(self, weight: float):
+        """[INTERNAL] raise ValueError if edge cannot have given weight."""
+        if (weight != 1.0):
+            if (not self._weighted):
+                raise ValueError("Cannot set weight while graph is not weighted, consider changing property `weighted` before!")
+            if (weight <= 0.0):
+                raise ValueError("Weight cannot be <= 0.0!")
+    
+    def add_vertices(self, vertices):
+        """Add all vertices from given iterable to graph. Storage of edges is resized once."""
+        count = len(self._vertices)
+        self._vertices.extend(vertices)
+        for idx in range(count, len(self._vertices)):
+            self._index_vertex(self._vertices[idx], idx)
+        self._edges.append(len(self._vertices) - count)
+        self._all_pairs = None
+    
+    def add_edges(self, edges, new_vertices: bool=False):
+        """Connect vertices by all edges from given iterable (it's read once, so it can be a generator).
+        Edge is (vertex 1, vertex 2) or (vertex 1, vertex 2, weight) and is validated as in `connect`,
+        if any edge is not valid ValueError is raised and graph is not changed.
+        [new_vertices] - False - vertices of edges must be in graph, True - vertices which are not in graph are added to it (in order of first occurrence)."""
+        count = len(self._vertices)
+        sources = array("q")
+        targets = array("q")
+        weights = array("d")
+        def index(vertex, number: int) -> int:
+            idx = self.find(vertex)
+            if (idx == -1):
+                if (not new_vertices):
+                    raise ValueError("Given vertex {0} is not in graph!".format(number))
+                idx = len(self._vertices)
+                self._index_vertex(vertex, idx)
+                self._vertices.append(vertex)
+            return idx
+        try:
+            for edge in edges:
+                if (len(edge) not in (2, 3)):
+                    raise ValueError("Edge must be (vertex 1, vertex 2) or (vertex 1, vertex 2, weight)!")
+                weight = float(edge[2]) if len(edge) == 3 else 1.0
+                self._check_weight(weight)
+                if (edge[0] == edge[1]):
+                    raise ValueError("Cannot connect vertex to itself!")
+                idx1 = index(edge[0], 1)
+                idx2 = index(edge[1], 2)
+                sources.append(idx1)
+                targets.append(idx2)
+                weights.append(weight)
+                if (not self._oriented):
+                    sources.append(idx2)
+                    targets.append(idx1)
+                    weights.append(weight)
+        except BaseException:
+            if (len(self._vertices) != count):
+                del self._vertices[count:]
+                self._reindex()
+            raise
+        self._edges.append(len(self._vertices) - count)
+        self._edges.set_many(sources, targets, weights)
+        self._all_pairs = None
+    
+    @staticmethod
+    def from_edges(edges, vertices=(), oriented: bool=False, weighted: bool=False, sparse: bool=False):
+        """Create a new Graph from given edges (see `add_edges`), storage of edges is sized once.
+        `edges` - iterable of edges (vertex 1, vertex 2) or (vertex 1, vertex 2, weight), vertices which are not in `vertices` are added in order of first occurrence;
+        [vertices] - iterable of vertices added before edges (e.g. vertices without edges);
+        [oriented], [weighted], [sparse] - properties of graph (see `Graph`)."""
+        graph = Graph(sparse)
+        graph.oriented = oriented
+        graph.weighted = weighted
+        graph.add_vertices(vertices)
+        graph.add_edges(edges, True)
+        return graph
+    
+    @staticmethod
+    def read_edges(filepath: str, delimiter: str=None, vertex=str, skip: int=0, oriented: bool=False, weighted: bool=False, sparse: bool=False):
+        """Create a new Graph from text file of edges in one pass: every line is "vertex1 vertex2" or "vertex1 vertex2 weight", empty lines are ignored.
+        `filepath` - path to file;
+        [delimiter] - separator of values, None - any whitespace;
+        [vertex] - function converting text of vertex to vertex (e.g. int), str by default;
+        [skip] - count of lines skipped at start of file (header);
+        [oriented], [weighted], [sparse] - properties of graph (see `Graph`).
+        Raises ValueError if any line is not valid edge."""
+        def parse(f):
+            for number, line in enumerate(f, 1):
+                if (number > skip):
+                    line = line.strip()
+                    values = line.split(delimiter)
+                    if (len(values) in (2, 3)):
+                        yield (vertex(values[0].strip()), vertex(values[1].strip())) + tuple(values[2:])
+                    elif (line):
+                        raise ValueError("Line {0} is not an edge: {1!r}".format(number, line))
+        with open(filepath) as f:
+            return Graph.from_edges(parse(f), (), oriented, weighted, sparse)
             
     def disconnect(self, vtx1, vtx2):
         """Disconnect given vertices.
@@ -115,9 +418,10 @@ class Graph():
             raise ValueError("Given vertex 1 is not in graph!")
         if (idx2 == -1):
             raise ValueError("Given vertex 2 is not in graph!")
-        self._edges[idx1][idx2] = 0.0
+        self._edges.set(idx1, idx2, 0.0)
         if (not self._oriented):
-            self._edges[idx2][idx1] = 0.0
+            self._edges.set(idx2, idx1, 0.0)
+        self._all_pairs = None
             
     def weight(self, vtx1, vtx2) -> float:
         """Get weight between given vertices.
@@ -132,7 +436,7 @@ class Graph():
             raise ValueError("Given vertex 1 is not in graph!")
         if (idx2 == -1):
             raise ValueError("Given vertex 2 is not in graph!")
-        return self._edges[idx1][idx2]
+        return self._edges.get(idx1, idx2)
     
     def connected(self, vtx1, vtx2) -> bool:
         """Whether given vertices are connected or not.
@@ -143,3 +447,172 @@ class Graph():
             return self.weight(vtx1, vtx2) != 0.0
         except ValueError:
             raise
+    
+    def _search_start(self, source, target):
+        """[INTERNAL] get indices of source and target (-1 if it's None) vertices and initial distances and previous vertices of search."""
+        start = self.find(source)
+        if (start == -1):
+            raise ValueError("Source vertex is not in graph!")
+        goal = -1
+        if (target is not None):
+            goal = self.find(target)
+            if (goal == -1):
+                raise ValueError("Target vertex is not in graph!")
+        distances = array("d", [inf]) * len(self._vertices)
+        distances[start] = 0.0
+        return start, goal, distances, array("q", [-1]) * len(self._vertices)
+    
+    def bfs(self, source, target=None) -> ShortestPaths:
+        """Find paths with least count of edges from `source` vertex by breadth-first search (weights are ignored, distance is count of edges).
+        [target] - stop when path to this vertex is found.
+        Raises ValueError if source or target is not in graph."""
+        start, goal, distances, previous = self._search_start(source, target)
+        queue = deque([start])
+        while (queue and (goal == -1 or distances[goal] == inf)):
+            i = queue.popleft()
+            d = distances[i] + 1.0
+            for j, w in self._edges.neighbors(i):
+                if (distances[j] == inf):
+                    distances[j] = d
+                    previous[j] = i
+                    queue.append(j)
+        return ShortestPaths(self, start, distances, previous)
+    
+    def dijkstra(self, source, target=None) -> ShortestPaths:
+        """Find shortest (by sum of weights) paths from `source` vertex by Dijkstra's algorithm with binary heap, O((V + E) * log(V)) for sparse graph.
+        [target] - stop when shortest path to this vertex is found.
+        Raises ValueError if source or target is not in graph."""
+        start, goal, distances, previous = self._search_start(source, target)
+        return self._search(start, goal, distances, previous, None)
+    
+    def astar(self, source, target, heuristic) -> ShortestPaths:
+        """Find shortest (by sum of weights) path from `source` to `target` vertex by A* search.
+        `heuristic` - function getting estimate of distance from given vertex to target vertex (called with both vertices),
+        path is surely shortest if estimate never exceeds real distance.
+        Raises ValueError if target is None, or source or target is not in graph."""
+        if (target is None):
+            raise ValueError("A* requires target vertex!")
+        start, goal, distances, previous = self._search_start(source, target)
+        vertices = self._vertices
+        return self._search(start, goal, distances, previous, lambda i: heuristic(vertices[i], target))
+    
+    def _search(self, start: int, goal: int, distances: array, previous: array, estimate) -> ShortestPaths:
+        """[INTERNAL] Dijkstra's algorithm (`estimate` is None) or A* search (`estimate` - function getting estimate of distance from vertex by index to goal)."""
+        heap = [(0.0 if estimate is None else estimate(start), 0.0, start)]
+        neighbors = self._edges.neighbors
+        while (heap):
+            priority, d, i = heappop(heap)
+            if (i == goal):
+                break
+            if (d > distances[i]):
+                continue
+            for j, w in neighbors(i):
+                dj = d + w
+                if (dj < distances[j]):
+                    distances[j] = dj
+                    previous[j] = i
+                    heappush(heap, (dj if estimate is None else dj + estimate(j), dj, j))
+        return ShortestPaths(self, start, distances, previous)
+    
+    def all_pairs(self) -> AllPairsShortestPaths:
+        """Get shortest paths between all pairs of vertices. They're calculated once and cached until graph is changed (`connect`, `disconnect`, `remove` etc.).
+        Graph with edges in adjacency matrix is solved by Floyd-Warshall algorithm (O(V^3), with NumPy if it's available),
+        sparse graph by Dijkstra's algorithm from every vertex (O(V * (V + E) * log(V))) split between processes of executor set by `Matrix.set_executor`."""
+        if (self._all_pairs is None):
+            n = len(self._vertices)
+            if (self.sparse):
+                distances, hops = self._all_pairs_dijkstra(n)
+            else:
+                distances, hops = self._all_pairs_floyd_warshall(n)
+            self._all_pairs = AllPairsShortestPaths(self, distances, hops)
+        return self._all_pairs
+    
+    def distance(self, vtx1, vtx2) -> float:
+        """Get length of shortest path from `vtx1` to `vtx2` vertex, inf if there is no path (see `all_pairs`).
+        Raises ValueError if any vertex is not in graph."""
+        return self.all_pairs().distance(vtx1, vtx2)
+    
+    def _all_pairs_floyd_warshall(self, n: int) -> tuple:
+        """[INTERNAL] get distances and next hops of shortest paths between all pairs of vertices by Floyd-Warshall algorithm."""
+        distances = array("d", [inf]) * (n * n)
+        hops = array("i", [-1]) * (n * n)
+        distances[::n + 1] = array("d", [0.0]) * n
+        for i, j, w in self._edges.edges():
+            distances[i * n + j] = w
+            hops[i * n + j] = j
+        if (numpy is not None and n >= NUMPY_MIN_VERTICES):
+            d = numpy.frombuffer(distances).reshape(n, n)
+            h = numpy.frombuffer(hops, dtype=numpy.int32).reshape(n, n)
+            for k in range(n):
+                through = d[:, k, None] + d[k]
+                shorter = through < d
+                d[shorter] = through[shorter]
+                h[shorter] = numpy.broadcast_to(h[:, k, None], (n, n))[shorter]
+            return distances, hops
+        for k in range(n):
+            row_k = distances[k * n:(k + 1) * n]
+            for i in range(n):
+                start = i * n
+                d = distances[start + k]
+                if (d != inf and i != k):
+                    hop = hops[start + k]
+                    for j, through, current in zip(range(n), map(add, repeat(d), row_k), distances[start:start + n]):
+                        if (through < current):
+                            distances[start + j] = through
+                            hops[start + j] = hop
+        return distances, hops
+    
+    def _all_pairs_dijkstra(self, n: int) -> tuple:
+        """[INTERNAL] get distances and next hops of shortest paths between all pairs of vertices by Dijkstra's algorithm from every vertex."""
+        indptr, indices, weights = self._csr()
+        if (Matrix._executor is None or n <= PARALLEL_MIN_VERTICES):
+            distances = array("d", [inf]) * (n * n)
+            hops = array("i", [-1]) * (n * n)
+            Graph._all_pairs_rows(indptr, indices, weights, distances, hops, 0, n)
+            return distances, hops
+        with parallel.SharedArray.from_array(indptr) as shared_indptr, parallel.SharedArray.from_array(indices) as shared_indices, parallel.SharedArray.from_array(weights) as shared_weights:
+            with parallel.SharedArray(n * n) as shared_distances, parallel.SharedArray(n * n, typecode="i") as shared_hops:
+                parallel.run(Matrix._executor, Matrix._workers, parallel._all_pairs_task, 0, n, n, len(indices), shared_indptr.name, shared_indices.name, shared_weights.name, shared_distances.name, shared_hops.name)
+                distances = array("d", [0.0]) * (n * n)
+                hops = array("i", [0]) * (n * n)
+                shared_distances.copy_to(distances)
+                shared_hops.copy_to(hops)
+        return distances, hops
+    
+    def _csr(self) -> tuple:
+        """[INTERNAL] get edges as flat arrays in compressed sparse row format: edges of vertex `i` are at positions from `indptr[i]` to `indptr[i + 1]`
+        in `indices` (target vertices) and `weights`, in same order as in adjacency dicts."""
+        adjacency = self._edges.adjacency
+        indptr = array("q", [0]) * (len(adjacency) + 1)
+        indices = array("i")
+        weights = array("d")
+        for i, edges in enumerate(adjacency):
+            indices.extend(edges.keys())
+            weights.extend(edges.values())
+            indptr[i + 1] = len(indices)
+        return indptr, indices, weights
+    
+    @staticmethod
+    def _all_pairs_rows(indptr, indices, weights, distances, hops, start: int, stop: int):
+        """[INTERNAL] write distances and next hops of shortest paths from vertices from `start` to `stop` to all vertices to flat tables
+        (Dijkstra's algorithm over edges in compressed sparse row format, see `_csr`). Rows of tables from `start` to `stop` are fully overwritten."""
+        n = len(indptr) - 1
+        for source in range(start, stop):
+            row = array("d", [inf]) * n
+            first = array("i", [-1]) * n
+            row[source] = 0.0
+            heap = [(0.0, source)]
+            while (heap):
+                d, i = heappop(heap)
+                if (d > row[i]):
+                    continue
+                hop = first[i]
+                begin, end = indptr[i], indptr[i + 1]
+                for j, w in zip(indices[begin:end], weights[begin:end]):
+                    dj = d + w
+                    if (dj < row[j]):
+                        row[j] = dj
+                        first[j] = j if i == source else hop
+                        heappush(heap, (dj, j))
+            distances[source * n:(source + 1) * n] = row
+            hops[source * n:(source + 1) * n] = first
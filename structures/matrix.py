@@ -1,7 +1,38 @@
 from struct import pack, unpack, calcsize
 from math import sin, cos, radians
+from array import array
+from operator import add, sub, mul, neg
+from itertools import repeat
+from mmap import mmap, ACCESS_READ
+from sys import byteorder, float_info
+from os import cpu_count
+from numbers import Real
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from vector import Vector
+import elementwise
+import parallel
+
+# Matrix products with at least this count of multiplications are calculated with NumPy when it's available.
+NUMPY_MIN_PRODUCT = 32 ** 3
+# Count of right operand columns processed at once while multiplying matrices.
+PRODUCT_BLOCK_SIZE = 64
+# Matrix products with at least this count of multiplications are split between processes of executor set by `Matrix.set_executor` (when NumPy isn't used).
+PARALLEL_MIN_PRODUCT = 64 ** 3
+# Eliminations update rows in processes of executor set by `Matrix.set_executor` while more than this count of rows is below current panel of pivots.
+PARALLEL_MIN_ROWS = 128
+# Count of pivot columns in panel of parallel elimination: rows below panel are updated in processes once per panel.
+PARALLEL_PANEL_COLUMNS = 32
+# Matrix file header: magic, format version, element type ("d" or "f"), byte order of elements ("<" or ">"), rows, columns.
+MATRIX_FILE_HEADER = "<4sBccxqq"
+MATRIX_FILE_MAGIC = b"MTRX"
+MATRIX_FILE_VERSION = 1
+# Count of characters read at once while parsing text (CSV) matrix files.
+CSV_CHUNK_SIZE = 1 << 20
 
 class ZeroDeterminantException(Exception):
     """Exception in case of zero determinant."""
@@ -13,15 +44,138 @@ class WrongDimensionsException(Exception):
     def __init__(self, message: str=""):
         super().__init__("Matrix have wrong dimensions! " + message)
 
+class MatrixRow(Vector):
+    """Row of a Matrix. Shares storage with the matrix: changing elements of the row changes the matrix.
+    Row has fixed length, methods that change it raise TypeError.
+    Row is bound to position in the matrix and is no longer valid after matrix is resized or its rows/columns are inserted or removed."""
+    __slots__ = ("_matrix",)
+    
+    def __init__(self, buffer: memoryview, matrix):
+        """Create a new MatrixRow object over given `buffer` (slice of storage of `matrix`)."""
+        self._values = buffer
+        self._matrix = matrix
+    
+    def __setitem__(self, key, value):
+        if (isinstance(key, slice)):
+            value = array("d", value)
+            if (len(value) != len(range(*key.indices(len(self._values))))):
+                raise ValueError("Matrix row has fixed length, slice must be set to sequence of same length!")
+        self._values[key] = value
+        self._matrix._version += 1
+    
+    def __iadd__(self, other):
+        Vector.__iadd__(self, other)
+        self._matrix._version += 1
+        return self
+    
+    def __isub__(self, other):
+        Vector.__isub__(self, other)
+        self._matrix._version += 1
+        return self
+    
+    def __imul__(self, other):
+        Vector.__imul__(self, other)
+        self._matrix._version += 1
+        return self
+    
+    def _fixed_length(self, *args, **kwargs):
+        """[INTERNAL] raise TypeError for methods which change length of the row."""
+        raise TypeError("Matrix row has fixed length!")
+    
+    clear = append = insert = extend = pop = _fixed_length
+
+class LUDecomposition():
+    """LU decomposition with partial pivoting of a square matrix: P*A = L*U.
+    `lu`: Matrix - L (below main diagonal, its unit diagonal is not stored) and U (main diagonal and above) packed in one matrix;
+    `pivots`: list - row permutation, i-th row of P*A is `pivots[i]`-th row of A;
+    `sign`: int - sign of permutation (1 or -1);
+    `singular`: bool - whether decomposed matrix is singular (zero pivot was met)."""
+    def __init__(self, mat):
+        """Create a new LUDecomposition object of given square matrix. Given matrix is not changed.
+        Raises WrongDimensionsException if matrix is not square or empty."""
+        if (mat.columns != mat.rows):
+            raise WrongDimensionsException("Matrix must be square to make LU decomposition!")
+        if (mat.rows < 1):
+            raise WrongDimensionsException("One or all dimensions of matrix is zero!")
+        self.lu = mat.copy()
+        self.pivots = list(range(mat.rows))
+        self.sign = 1
+        self.singular = False
+        self._triangles = None
+        n = mat.rows
+        if (Matrix._executor is None or n <= PARALLEL_MIN_ROWS):
+            self._decompose(self.lu, None)
+        else:
+            with parallel.SharedArray.from_array(self.lu._data) as shared:
+                self._decompose(Matrix._from_array(shared.data, n, n), shared)
+                shared.copy_to(self.lu._data)
+    
+    def _decompose(self, lu, shared):
+        """[INTERNAL] decompose matrix `lu` in place. Rows are updated in parallel if `shared` array (storage of `lu`) is given."""
+        swaps, self.singular = Matrix._eliminate(lu, True, shared)
+        for i, j in swaps:
+            self.pivots[i], self.pivots[j] = self.pivots[j], self.pivots[i]
+            self.sign = -self.sign
+    
+    def determinant(self) -> float:
+        """Get determinant of decomposed matrix."""
+        if (self.singular):
+            return 0.0
+        det = float(self.sign)
+        for e in self.lu._data[::self.lu.columns + 1]:
+            det *= e
+        return det
+    
+    def solve(self, b) -> Vector:
+        """Solve system of linear equations A*x = `b` (`b` - sequence of numbers) for decomposed matrix A and return x.
+        Raises ZeroDeterminantException if decomposed matrix is singular."""
+        if (self.singular):
+            raise ZeroDeterminantException()
+        n = self.lu.rows
+        if (len(b) != n):
+            raise ValueError("`b` must have length equal to matrix row count!")
+        if (self._triangles is None):
+            d = self.lu._data
+            self._triangles = ([d[i * n:i * n + i] for i in range(n)], [d[i * n + i + 1:(i + 1) * n] for i in range(n)], d[::n + 1])
+        lower, upper, diagonal = self._triangles
+        y = []
+        for i in range(n):
+            y.append(b[self.pivots[i]] - sum(map(mul, lower[i], y)))
+        x = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            x[i] = (y[i] - sum(map(mul, upper[i], x[i + 1:]))) / diagonal[i]
+        return Vector(x)
+    
+    def lower(self):
+        """Get L matrix (lower triangle with unit main diagonal)."""
+        n = self.lu.rows
+        m = Matrix.identity(n)
+        for i in range(1, n):
+            m._data[i * n:i * n + i] = self.lu._data[i * n:i * n + i]
+        return m
+    
+    def upper(self):
+        """Get U matrix (upper triangle)."""
+        n = self.lu.rows
+        m = Matrix(n, n)
+        for i in range(n):
+            m._data[i * n + i:(i + 1) * n] = self.lu._data[i * n + i:(i + 1) * n]
+        return m
+
 class Matrix():
-    """Class representing mathematical Matrix."""
+    """Class representing mathematical Matrix.
+    Elements are stored as float numbers in one flat row-major array, rows are accessed through MatrixRow views (`mat[i][j]`)."""
+    _executor = None
+    _workers = 1
+    
     def __init__(self, rows: int, columns: int):
         """Create a new Matrix object. `rows` - count of rows in this matrix, `columns` - count of columns in this matrix."""
         if(rows < 0 or columns < 0):
             raise ValueError("Matrix cannot have negative dimensions!")
-        self._rows = rows
-        self._columns = columns
-        self._mat = [Vector([0.0 for j in range(self._columns)]) for i in range(self._rows)]
+        self._version = 0
+        self._cache = {}
+        self._cache_version = 0
+        self._set_storage(array("d", [0.0]) * (rows * columns), rows, columns)
         
     @property
     def rows(self):
@@ -42,49 +196,65 @@ class Matrix():
         """Get/set column count of this matrix."""
         if (self._columns != int(value)):
             self.resize(columns=int(value))
+    
+    @staticmethod
+    def set_executor(executor, workers: int=None):
+        """Set process pool for parallel matrix products and eliminations (to_lower_triangle, gauss, LU decomposition, determinant) of big matrices.
+        Elements are passed to processes through shared memory. Products calculated with NumPy are not split (NumPy uses all cores itself).
+        `executor` - concurrent.futures.ProcessPoolExecutor (owned by caller), None - turn parallel mode off;
+        [workers] - count of blocks work is split into, CPU count by default."""
+        Matrix._executor = executor
+        Matrix._workers = workers or cpu_count() or 1
             
     @staticmethod
     def identity(size: int):
         """Create and return a new identity Matrix of given size (all elements are 0.0 except main diagonal - they are 1.0)."""
         out = Matrix(size, size)
-        for i in range(size):
-            out[i][i] = 1.0
+        out._data[::size + 1] = array("d", [1.0]) * size
         return out
     
+    @staticmethod
+    def from_numpy(arr):
+        """Create and return a new Matrix from given two-dimensional NumPy array (elements are converted to float).
+        Raises ImportError if NumPy is not installed."""
+        if (numpy is None):
+            raise ImportError("NumPy is required to create matrix from NumPy array!")
+        arr = numpy.asarray(arr)
+        if (arr.ndim != 2):
+            raise WrongDimensionsException("NumPy array must be two-dimensional!")
+        m = Matrix(*arr.shape)
+        numpy.frombuffer(m._data).reshape(arr.shape)[...] = arr
+        return m
+    
     @staticmethod
     def minor(mat, i: int, j: int):
         """Get minor of given matrix (given matrix without `i`-th row and `j`-th column)."""
         if ((i >= mat.rows or i < 0) or (j >= mat.columns or j < 0)):
             raise IndexError
-        m = mat.copy()
-        m._rows -= 1
-        m._columns -= 1
-        mat = m._mat[:i]
-        mat.extend(m._mat[i+1:])
-        m._mat = mat.copy()
-        for i, row in enumerate(m._mat):
-            r = row[:j]
-            r.extend(row[j+1:])
-            m._mat[i] = r.copy()
-        return m
+        d = mat._data
+        c = mat._columns
+        data = array("d")
+        for r in range(mat._rows):
+            if (r != i):
+                start = r * c
+                data += d[start:start + j]
+                data += d[start + j + 1:start + c]
+        return Matrix._from_array(data, mat._rows - 1, c - 1)
     
     @staticmethod
     def determinant(mat) -> float:
-        """Get determinant of given matrix."""
+        """Get determinant of given matrix. Matrices larger than 2x2 are calculated through LU decomposition."""
         if (mat.columns != mat.rows):
             raise WrongDimensionsException("Matrix must be square to find determinant!")
         if (mat.rows < 1):
             raise WrongDimensionsException("One or all dimensions of matrix is zero!")
+        d = mat._data
         if (mat.rows == 1):
-            return mat._mat[0][0]
+            return d[0]
         elif (mat.rows == 2):
-            return mat._mat[0][0] * mat._mat[1][1] - mat._mat[0][1] * mat._mat[1][0]
+            return d[0] * d[3] - d[1] * d[2]
         else:
-            d = 0
-            for i in range(mat.rows):
-                m = Matrix.minor(mat, i, 0)
-                d += (-1)**i * mat[i][0] * Matrix.determinant(m)
-            return d
+            return mat.lu().determinant()
                     
     @staticmethod
     def gauss(mat, vec: Vector) -> Vector:
@@ -94,26 +264,157 @@ class Matrix():
         m = mat.copy()
         m.insert_column(vec, m.columns)
         m.to_lower_triangle()
-        result = Vector([0.0 for i in range(len(vec))])
+        d = m._data
+        c = m.columns
+        result = [0.0 for i in range(len(vec))]
         for i in range(m.rows - 1, -1, -1):
             summ = 0.0
-            for j in range(m.columns - 2, i, -1):
-                summ += m[i][j] * result[j]
-            result[i] = (m[i][m.columns - 1] - summ) / m[i][i]
-        return result    
+            for j in range(c - 2, i, -1):
+                summ += d[i * c + j] * result[j]
+            result[i] = (d[i * c + c - 1] - summ) / d[i * c + i]
+        return Vector(result)
         
     @staticmethod
     def _column_max(mat, col: int) -> float:
         """[INTERNAL] get maximum element in given column of given matrix."""
-        mx = abs(mat[col][col])
+        column = mat._data[col * mat._columns + col::mat._columns]
+        mx = abs(column[0])
         max_idx = col
-        for i in range(col + 1, mat.rows):
-            e = abs(mat[i][col])
+        for i, e in enumerate(column):
+            e = abs(e)
             if (e > mx):
                 mx = e
-                max_idx = i
+                max_idx = col + i
         return max_idx
     
+    @staticmethod
+    def _product(m1, m2) -> array:
+        """[INTERNAL] get flat storage of product of two matrices.
+        Uses NumPy for big matrices if it's available, otherwise columns of `m2` are taken once and multiplied by rows of `m1` in blocks."""
+        r = m1._rows
+        c = m1._columns
+        oc = m2._columns
+        if (numpy is not None and r * c * oc >= NUMPY_MIN_PRODUCT):
+            data = array("d", [0.0]) * (r * oc)
+            numpy.matmul(numpy.frombuffer(m1._data).reshape(r, c), numpy.frombuffer(m2._data).reshape(c, oc), out=numpy.frombuffer(data).reshape(r, oc))
+            return data
+        if (Matrix._executor is not None and r * c * oc >= PARALLEL_MIN_PRODUCT):
+            return parallel.product(Matrix._executor, Matrix._workers, m1._data, m2._data, r, c, oc)
+        data = array("d", [0.0]) * (r * oc)
+        Matrix._product_rows(m1._data, m2._data, data, c, oc, 0, r)
+        return data
+    
+    @staticmethod
+    def _product_rows(a, b, out, c: int, oc: int, start: int, stop: int):
+        """[INTERNAL] calculate rows from `start` to `stop` of product of flat storages `a` (`c` columns) and `b` (`oc` columns) into flat storage `out`.
+        Columns of `b` are taken once and multiplied by rows of `a` in blocks."""
+        rows = [a[i * c:(i + 1) * c] for i in range(start, stop)]
+        cols = [b[j:c * oc:oc] for j in range(oc)]
+        for jb in range(0, oc, PRODUCT_BLOCK_SIZE):
+            block = cols[jb:jb + PRODUCT_BLOCK_SIZE]
+            for i, row in enumerate(rows, start):
+                s = i * oc + jb
+                out[s:s + len(block)] = array("d", [sum(map(mul, row, col)) for col in block])
+    
+    @staticmethod
+    def _eliminate(mat, lu: bool, shared) -> tuple:
+        """[INTERNAL] eliminate elements below main diagonal of `mat` in place by Gaussian elimination with partial pivoting.
+        `lu` - False - eliminated elements become 0.0, True - multipliers are stored in place of them (LU decomposition);
+        `shared` - shared array (storage of `mat`) or None. If it's given, pivots are taken in panels of PARALLEL_PANEL_COLUMNS columns:
+        panel columns and pivot rows are eliminated here, then columns after panel of all rows below it are updated in processes of executor at once.
+        Every element gets same operations in same order as without panels, so results are equal.
+        Returns list of swapped rows (i, j) in order of swaps and whether zero pivot was met."""
+        d = mat._data
+        r = mat._rows
+        c = mat._columns
+        count = r if lu else min(r - 1, c)
+        width = PARALLEL_PANEL_COLUMNS
+        swaps = []
+        singular = False
+        factors = None
+        k = 0
+        try:
+            while (k < count):
+                panel = shared is not None and r - k - width > PARALLEL_MIN_ROWS
+                if (panel and factors is None):
+                    factors = parallel.SharedArray(r * width)
+                stop = min(k + width, count) if panel else count
+                end = stop if panel else c
+                f = factors.data if panel else None
+                for i in range(k, stop):
+                    max_idx = Matrix._column_max(mat, i)
+                    if (d[max_idx * c + i] == 0.0):
+                        singular = True
+                        continue
+                    if (i != max_idx):
+                        mat.swap_rows(i, max_idx)
+                        if (panel):
+                            row = array("d", f[i * width:(i + 1) * width].tobytes())
+                            f[i * width:(i + 1) * width] = f[max_idx * width:(max_idx + 1) * width]
+                            f[max_idx * width:(max_idx + 1) * width] = row
+                        swaps.append((i, max_idx))
+                    Matrix._eliminate_rows(d, c, i, i + 1, r, end, lu, f, width)
+                if (panel):
+                    Matrix._update_rows(d, c, k, stop, lu, f, width, k, stop)
+                    parallel.run(Matrix._executor, Matrix._workers, parallel._update_task, stop, r, shared.name, factors.name, r, c, k, stop, lu, width)
+                    f[:] = array("d", [0.0]) * (r * width)
+                k = stop
+        finally:
+            if (factors is not None):
+                factors.close()
+        return swaps, singular
+    
+    @staticmethod
+    def _eliminate_rows(d, c: int, i: int, start: int, stop: int, end: int, lu: bool, factors=None, width: int=0):
+        """[INTERNAL] eliminate `i`-th elements of rows from `start` to `stop` of flat storage `d` (`c` columns) by `i`-th row, only columns before `end` are updated.
+        `lu` - False - `i`-th row multiplied by factor is added, so `i`-th elements become 0.0, True - `i`-th row multiplied by multiplier is subtracted and multiplier is stored in place of `i`-th element;
+        [factors] - flat storage (`width` columns) to write factor of every row to, at (row, `i` % `width`) pos (see `_update_rows`)."""
+        pivot = d[i * c + i]
+        first = i + 1 if lu else i
+        pivot_row = d[i * c + first:i * c + end]
+        for j in range(start, stop):
+            s = j * c + i
+            factor = d[s] / pivot if lu else -d[s] / pivot
+            if (factor != 0.0):
+                if (lu):
+                    d[s] = factor
+                    d[s + 1:j * c + end] = array("d", map(sub, d[s + 1:j * c + end], map(mul, pivot_row, repeat(factor))))
+                else:
+                    d[s:j * c + end] = array("d", map(add, d[s:j * c + end], map(mul, pivot_row, repeat(factor))))
+            if (factors is not None):
+                factors[j * width + i % width] = factor
+    
+    @staticmethod
+    def _update_rows(d, c: int, k: int, stop_pivot: int, lu: bool, factors, width: int, start: int, stop: int):
+        """[INTERNAL] apply eliminations by pivot rows from `k` to `stop_pivot` with factors written by `_eliminate_rows` to columns from `stop_pivot` of rows from `start` to `stop` (see `_eliminate`).
+        Rows are updated in order, so pivot row is complete before it's used for next rows."""
+        func = sub if lu else add
+        for j in range(start, stop):
+            s = j * c + stop_pivot
+            row = d[s:(j + 1) * c]
+            changed = False
+            for i in range(k, min(stop_pivot, j)):
+                factor = factors[j * width + i - k]
+                if (factor != 0.0):
+                    row = array("d", map(func, row, map(mul, d[i * c + stop_pivot:(i + 1) * c], repeat(factor))))
+                    changed = True
+            if (changed):
+                d[s:(j + 1) * c] = row
+    
+    @staticmethod
+    def _insert_index(index: int, size: int) -> int:
+        """[INTERNAL] get position for insertion before `index` in sequence of given `size` (same as list.insert does)."""
+        if (index < 0):
+            index = max(size + index, 0)
+        return min(index, size)
+    
+    @staticmethod
+    def _from_array(data: array, rows: int, columns: int):
+        """[INTERNAL] create a new Matrix object over given flat row-major `data` (not copied)."""
+        m = Matrix(0, 0)
+        m._set_storage(data, rows, columns)
+        return m
+    
     @staticmethod
     def make_translation(dx: float, dy: float, dz: float=None):
         """Make translation matrix 2d or 3d if dz is given."""
@@ -131,25 +432,20 @@ class Matrix():
     @staticmethod
     def make_rotation(angle_x: float, angle_y: float, angle_z: float=None):
         """Make rotation matrix 2d or 3d if angle_z is given."""
-        mat_x = Matrix.identity(3)
-        mat_x[1][1] = cos(radians(angle_x))
-        mat_x[1][2] = -sin(radians(angle_x))
-        mat_x[2][1] = sin(radians(angle_x))
-        mat_x[2][2] = cos(radians(angle_x))
-        mat_y = Matrix.identity(3)
-        mat_y[0][0] = cos(radians(angle_y))
-        mat_y[0][2] = sin(radians(angle_y))
-        mat_y[2][0] = -sin(radians(angle_y))
-        mat_y[2][2] = cos(radians(angle_y))
-        mat_z = Matrix.identity(3)
-        if (angle_z != None):
-            mat_z[0][0] = cos(radians(angle_z))
-            mat_z[0][1] = -sin(radians(angle_z))
-            mat_z[1][0] = sin(radians(angle_z))
-            mat_z[1][1] = cos(radians(angle_z))
-        mat = mat_x * mat_y * mat_z
+        mat = Matrix(3, 3)
+        mat._data[:] = array("d", Matrix._rotation(angle_x, angle_y, angle_z if angle_z != None else 0.0))
         return mat
     
+    @staticmethod
+    def _rotation(angle_x: float, angle_y: float, angle_z: float) -> tuple:
+        """[INTERNAL] get elements (row by row) of 3x3 rotation matrix around x, then y, then z axes (angles in degrees)."""
+        sx, cx = sin(radians(angle_x)), cos(radians(angle_x))
+        sy, cy = sin(radians(angle_y)), cos(radians(angle_y))
+        sz, cz = sin(radians(angle_z)), cos(radians(angle_z))
+        return (cy * cz, -cy * sz, sy,
+                sx * sy * cz + cx * sz, cx * cz - sx * sy * sz, -sx * cy,
+                sx * sz - cx * sy * cz, cx * sy * sz + sx * cz, cx * cy)
+    
     @staticmethod
     def make_scale(x: float, y: float, z: float=None):
         """Make scale matrix 2d or 3d if z is given."""
@@ -165,16 +461,33 @@ class Matrix():
         return mat
         
     def __getitem__(self, key):
-        """Get row at `key` pos."""
-        return self._mat[key]
+        """Get row at `key` pos (MatrixRow sharing storage with this matrix). Slice gives list of rows.
+        Tuple key gives element at (i, j) pos or view of rows and columns at (slice, slice) pos (SubmatrixView sharing storage with this matrix)."""
+        if (isinstance(key, tuple)):
+            i, j = key
+            if (isinstance(i, int) and isinstance(j, int)):
+                return self._data[range(self._rows)[i] * self._columns + range(self._columns)[j]]
+            return SubmatrixView(self, i, j)
+        if (isinstance(key, slice)):
+            return [self[i] for i in range(*key.indices(self._rows))]
+        row = self._views[key]
+        if (row is None):
+            i = range(self._rows)[key]
+            start = i * self._columns
+            row = self._views[i] = MatrixRow(memoryview(self._data)[start:start + self._columns], self)
+        return row
     
     def __setitem__(self, key, value):
-        """Set row at `key` pos."""
-        if (len(value) == self._columns):
-            if (isinstance(value, (list, tuple))):
-                self._mat[key] = Vector(value)
-            elif (isinstance(value, Vector)):
-                self._mat[key] = value
+        """Set row at `key` pos or element at (i, j) pos."""
+        if (isinstance(key, tuple)):
+            i, j = key
+            self._data[range(self._rows)[i] * self._columns + range(self._columns)[j]] = value
+            self._version += 1
+        elif (len(value) == self._columns):
+            if (isinstance(value, (list, tuple, Vector))):
+                start = range(self._rows)[key] * self._columns
+                self._data[start:start + self._columns] = array("d", value)
+                self._version += 1
             else:
                 raise TypeError("`value` must be list, tuple or Vector object.")
         else:
@@ -182,27 +495,25 @@ class Matrix():
             
     def __iter__(self):
         """Iterate through all elements of matrix."""
-        for row in self._mat:
-            for e in row:
-                yield e
+        return iter(self._data)
             
     def __str__(self):
         """String representaion of this matrix."""
         out = "Matrix("
         max_len = 0
         negs = False
-        for row in self._mat:
-            for e in row:
-                if (len(str(int(e))) > max_len):
-                    max_len = len(str(abs(int(e))))
-                if (not negs and e < 0):
-                    negs = True
-        for i, row in enumerate(self._mat):
+        for e in self._data:
+            if (len(str(int(e))) > max_len):
+                max_len = len(str(abs(int(e))))
+            if (not negs and e < 0):
+                negs = True
+        for i in range(self._rows):
+            row = self._data[i * self._columns:(i + 1) * self._columns]
             for j, e in enumerate(row):
                 out += ("%" + str(max_len + 3 + (1 if e >= 0.0 and negs else 0)) + ".2f") % e
                 if (j != len(row) - 1):
                     out += " "
-            if (i != len(self._mat) - 1):
+            if (i != self._rows - 1):
                 out += "\n"
                 out += " " * 7
         out += ")"
@@ -210,88 +521,96 @@ class Matrix():
     
     def __eq__(self, other):
         """Whether two matrices are equal."""
+        if (isinstance(other, MatrixView)):
+            return other == self
         if (not isinstance(other, Matrix)):
             raise TypeError("Only matrices can be compared!")
-        return self._mat == other._mat
+        return self._rows == other._rows and self._columns == other._columns and self._data == other._data
+    
+    def __array__(self, dtype=None, copy=None):
+        """Get NumPy array of this matrix (NumPy array protocol)."""
+        arr = self.to_numpy(bool(copy))
+        if (dtype is not None):
+            arr = arr.astype(dtype, copy=False)
+        return arr
+    
+    def __buffer__(self, flags: int):
+        """Get two-dimensional memoryview of this matrix (buffer protocol, Python 3.12+)."""
+        return self.buffer()
     
     def __add__(self, other):
         """Add matrix or number to another and return it."""
-        m = self.copy()
-        if (isinstance(other, Matrix)):            
-            if ((self._rows != other._rows) and (self._columns != other._columns)):
-                raise WrongDimensionsException("Matrices must have equal size to perform this operation!")
-            for i in range(m.rows):
-                for j in range(m.columns):
-                    m[i][j] += other[i][j]
-        else:
-            for i in range(m.rows):
-                for j in range(m.columns):
-                    m[i][j] += other
-        return m
+        other = self._operand(other)
+        if (other is NotImplemented):
+            return other
+        return Matrix._from_array(elementwise.combine(add, self._data, other), self._rows, self._columns)
     
     def __iadd__(self, other):
-        """Add matrix or number to another and set result to current matrix."""
-        self._mat = (self + other)._mat
+        """Add matrix or number to this matrix in place (storage and rows of this matrix are kept)."""
+        other = self._operand(other)
+        if (other is NotImplemented):
+            return other
+        elementwise.combine(add, self._data, other, self._data)
+        self._version += 1
+        return self
         
     def __sub__(self, other):
         """Subtract from matrix another matrix or number and return it."""
-        m = self.copy()
-        if (isinstance(other, Matrix)):            
-            if ((self._rows != other._rows) and (self._columns != other._columns)):
-                raise WrongDimensionsException("Matrices must have equal size to perform this operation!")
-            for i in range(m.rows):
-                for j in range(m.columns):
-                    m[i][j] -= other[i][j]
-        else:
-            for i in range(m.rows):
-                for j in range(m.columns):
-                    m[i][j] -= other
-        return m
+        other = self._operand(other)
+        if (other is NotImplemented):
+            return other
+        return Matrix._from_array(elementwise.combine(sub, self._data, other), self._rows, self._columns)
     
     def __isub__(self, other):
-        """Subtract from matrix another matrix or number set result to current matrix."""
-        self._mat = (self - other)._mat
+        """Subtract from this matrix another matrix or number in place (storage and rows of this matrix are kept)."""
+        other = self._operand(other)
+        if (other is NotImplemented):
+            return other
+        elementwise.combine(sub, self._data, other, self._data)
+        self._version += 1
+        return self
         
     def __mul__(self, other):
         """Multiply matrix by another matrix, sequence or number."""
         if (isinstance(other, (list, tuple, Vector))):
             if (self._rows != len(other)):
                 raise ValueError("`other` must have length equal to matrix row count.")
-            if (not isinstance(other, Vector)):
-                other = Vector(other)
-            result = Vector()
-            for i in range(self.columns):
-                result.append(0.0)
-                for k in range(self.rows):
-                    result[i] += self[k][i] * other[k]
-            return result
+            other = list(other)
+            c = self._columns
+            return Vector([sum(map(mul, self._data[j::c], other)) for j in range(c)])
         if (isinstance(other, Matrix)):
-            m = Matrix(self._rows, other._columns)
             if (self._columns != other._rows):
                 raise WrongDimensionsException("First matrix must have column count equal to second matrix's row count to perform this operation!")
-            for i in range(m.rows):
-                for j in range(other.columns):
-                    m[i][j] = 0.0
-                    for k in range(self.columns):
-                        m[i][j] += self[i][k] * other[k][j]
-        else:
-            m = self.copy()
-            for i in range(m.rows):
-                for j in range(m.columns):
-                    m[i][j] *= other
-        return m
+            return Matrix._from_array(Matrix._product(self, other), self._rows, other._columns)
+        elif (isinstance(other, Real)):
+            return Matrix._from_array(elementwise.combine(mul, self._data, float(other)), self._rows, self._columns)
+        return NotImplemented
            
     def __rmul__(self, other):
         """Multiply to one matrix another matrix in reversed order or number and return it."""
-        print("FUCK")
         if (isinstance(other, Matrix)):
             return other * self
         else:
             return self * other
         
     def __imul__(self, other):
-        """Multiply to one matrix another matrix or number and set result to current matrix."""
-        self._mat = (self * other)._mat
+        """Multiply this matrix by another matrix or number in place.
+        Multiplying by number or by matrix which keeps dimensions of this matrix keeps its storage and rows.
+        Multiplying by sequence gives Vector (see `__mul__`)."""
+        if (isinstance(other, Matrix)):
+            if (self._columns != other._rows):
+                raise WrongDimensionsException("First matrix must have column count equal to second matrix's row count to perform this operation!")
+            data = Matrix._product(self, other)
+            if (other._rows == other._columns):
+                self._data[:] = data
+            else:
+                self._set_storage(data, self._rows, other._columns)
+        elif (isinstance(other, Real)):
+            elementwise.combine(mul, self._data, float(other), self._data)
+        else:
+            return NotImplemented
+        self._version += 1
+        return self
         
     def __div__(self, other):
         """Muliply one matrix by inversed matrix or 1/number and return it."""
@@ -309,66 +628,108 @@ class Matrix():
         
     def __idiv__(self, other):
         """Muliply one matrix by inversed matrix or 1/number and set result to current matrix."""
-        self._mat = (self / other)._mat
+        self._data = (self / other)._data
         
     def __neg__(self):
         """Return negative matrix to current (negate every element)."""
-        m = self.copy()
-        for row in m._mat:
-            for j, e in  enumerate(row):
-                row[j] = -e
-        return m
+        return Matrix._from_array(elementwise.apply(neg, self._data), self._rows, self._columns)
+    
+    def _operand(self, other):
+        """[INTERNAL] check operand of element-wise operation: get number or storage of matrix of same size.
+        Returns NotImplemented for other types."""
+        if (isinstance(other, Matrix)):
+            if ((self._rows != other._rows) or (self._columns != other._columns)):
+                raise WrongDimensionsException("Matrices must have equal size to perform this operation!")
+            return other._data
+        if (isinstance(other, Real)):
+            return float(other)
+        return NotImplemented
+    
+    def _set_storage(self, data: array, rows: int, columns: int):
+        """[INTERNAL] set flat row-major storage and dimensions of this matrix and drop cached row views.
+        Row views export buffer of storage so it cannot be resized in place - every change of dimensions must set a new array."""
+        self._data = data
+        self._rows = rows
+        self._columns = columns
+        self._views = [None] * rows
+        self._version += 1
         
     def clear(self):
         """Clear this matrix."""
-        self._mat.clear()
-        self._rows = self._columns = 0
+        self._set_storage(array("d"), 0, 0)
         
     def resize(self, rows: int=-1, columns: int=-1):
-        """Resize this matrix to given sizes. -1 - do not resize."""
-        if (rows > self._rows):
-            if (self._columns > 0):
-                self._mat = [Vector([0.0 for j in range(self._columns)]) for i in range(rows)]
-            else:
-                self._mat = [Vector([0.0]) for i in range(rows)]
-                self._columns = 1
-            self._rows = rows
-        elif (0 < rows < self._rows):
-            self._mat = self._mat[:rows]
-            self._rows = rows
+        """Resize this matrix to given sizes. -1 - do not resize. Existing elements are kept, new are 0.0."""
+        new_rows = self._rows
+        new_columns = self._columns
+        if (rows > new_rows):
+            if (new_columns == 0):
+                new_columns = 1
+            new_rows = rows
+        elif (0 < rows < new_rows):
+            new_rows = rows
         elif (rows == 0):
-            self.clear()
-        if (columns > self._columns):
-            if (self._rows == 0):
-                self._mat.append([0.0])
-                self._rows = 1
-                self._columns = 1
-            for row in self._mat:
-                row.extend([0.0 for j in range(columns - self._columns)])
-            self._columns = columns
-        elif (0 < columns < self._columns):
-            for i, row in enumerate(self._mat):
-                self._mat[i] = row[:columns]
-            self._columns = columns
+            new_rows = new_columns = 0
+        if (columns > new_columns):
+            if (new_rows == 0):
+                new_rows = 1
+            new_columns = columns
+        elif (0 < columns < new_columns):
+            new_columns = columns
         elif (columns == 0):
-            self.clear()
+            new_rows = new_columns = 0
+        if (new_rows == self._rows and new_columns == self._columns):
+            return
+        d = self._data
+        c = self._columns
+        if (new_columns == c):
+            data = d[:new_rows * c]
+        else:
+            data = array("d")
+            keep = min(c, new_columns)
+            pad = array("d", [0.0]) * (new_columns - keep)
+            for i in range(min(self._rows, new_rows)):
+                data += d[i * c:i * c + keep]
+                data += pad
+        data += array("d", [0.0]) * ((new_rows * new_columns) - len(data))
+        self._set_storage(data, new_rows, new_columns)
             
     def copy(self):
         """Return a copy of this matrix."""
-        m = Matrix(self._rows, self._columns)
-        for i, row in enumerate(self._mat):
-            m._mat[i] = row.copy()
-        return m
+        return Matrix._from_array(self._data[:], self._rows, self._columns)
+    
+    def apply(self, func):
+        """Get a new matrix with `func` applied to every element of this matrix."""
+        return Matrix._from_array(elementwise.apply(func, self._data), self._rows, self._columns)
+    
+    def map2(self, func, other):
+        """Get a new matrix of `func` results for every pair of elements of this matrix and `other` (matrix of same size or number)."""
+        operand = self._operand(other)
+        if (operand is NotImplemented):
+            raise TypeError("`other` must be a Matrix or number.")
+        return Matrix._from_array(elementwise.combine(func, self._data, operand), self._rows, self._columns)
+    
+    def to_numpy(self, copy: bool=False):
+        """Get two-dimensional NumPy array of this matrix. Raises ImportError if NumPy is not installed.
+        [copy] - False - array shares storage with this matrix (until matrix is resized or its rows/columns are inserted or removed), True - array is independent copy."""
+        if (numpy is None):
+            raise ImportError("NumPy is required to convert matrix to NumPy array!")
+        arr = numpy.frombuffer(self._data).reshape(self._rows, self._columns)
+        return arr.copy() if copy else arr
+    
+    def buffer(self) -> memoryview:
+        """Get two-dimensional memoryview sharing storage with this matrix (until matrix is resized or its rows/columns are inserted or removed).
+        Empty matrix gives empty one-dimensional memoryview."""
+        if (self._rows == 0 or self._columns == 0):
+            return memoryview(self._data)
+        return memoryview(self._data).cast("B").cast("d", [self._rows, self._columns])
             
     def transpose(self):
         """Transpose this matrix (turn rows into columns and vice versa.)."""
-        m = Matrix(self._columns, self._rows)
-        for i in range(self._rows):
-            for j in range(self._columns):
-                m[j][i] = self._mat[i][j]
-        self._columns = m.columns
-        self._rows = m.rows
-        self._mat = m._mat.copy()
+        data = array("d")
+        for j in range(self._columns):
+            data += self._data[j::self._columns]
+        self._set_storage(data, self._columns, self._rows)
             
     def transposed(self):
         """Get transposed version of this matrix."""
@@ -376,60 +737,151 @@ class Matrix():
         m.transpose()
         return m
     
+    def transposed_view(self):
+        """Get transposed view of this matrix (TransposedView sharing storage with this matrix, see MatrixView)."""
+        return TransposedView(self)
+    
+    def minor_view(self, i: int, j: int):
+        """Get view of this matrix without `i`-th row and `j`-th column (MinorView sharing storage with this matrix, see MatrixView)."""
+        return MinorView(self, i, j)
+    
     def inverse(self):
-        """Inverse this matrix."""
-        d = self.get_determinant()
-        if (d == 0):
-            raise ZeroDeterminantException()
-        t = self.transposed()
-        out = self.copy()
-        for i in range(out._rows):
-            for j in range(out._columns):
-                m = Matrix.minor(t, i, j)
-                out[i][j] = 1/d * (-1) ** (i + j) * m.get_determinant()
-        return out
+        """Inverse this matrix in place with Gauss-Jordan elimination (only for square matrix).
+        Raises ZeroDeterminantException if matrix is singular, elements of matrix are undefined in this case."""
+        if (self._columns != self._rows):
+            raise WrongDimensionsException("Matrix must be square to inverse it!")
+        if (self._rows < 1):
+            raise WrongDimensionsException("One or all dimensions of matrix is zero!")
+        self._version += 1
+        d = self._data
+        n = self._rows
+        swaps = []
+        for k in range(n):
+            max_idx = Matrix._column_max(self, k)
+            if (d[max_idx * n + k] == 0.0):
+                raise ZeroDeterminantException()
+            if (k != max_idx):
+                self.swap_rows(k, max_idx)
+                swaps.append((k, max_idx))
+            start = k * n
+            pivot = d[start + k]
+            d[start + k] = 1.0
+            d[start:start + n] = array("d", [e / pivot for e in d[start:start + n]])
+            pivot_row = d[start:start + n]
+            for i in range(n):
+                row = i * n
+                mul = d[row + k]
+                if (i != k and mul != 0.0):
+                    d[row + k] = 0.0
+                    d[row:row + n] = array("d", [a - b * mul for a, b in zip(d[row:row + n], pivot_row)])
+        for k, max_idx in reversed(swaps):
+            self.swap_columns(k, max_idx)
     
     def inversed(self):
-        """Get inversed version of this matrix."""
+        """Get inversed version of this matrix. Inversed matrix is cached until this matrix changes, copy of it is returned."""
+        return self._cached("inverse", self._inversed).copy()
+    
+    def _inversed(self):
+        """[INTERNAL] calculate inversed version of this matrix."""
         m = self.copy()
         m.inverse()
         return m
     
     def to_lower_triangle(self):
-        """Turn given matrix into lower triangle state (elements below main diagonal are 0.0)."""
-        for i in range(self.rows - 1):
-            max_idx = Matrix._column_max(self, i)
-            if (i != max_idx):
-                self.swap_rows(i, max_idx)
-            for j in range(i + 1, self.rows):
-                mul = -self[j][i] / self[i][i]
-                for k in range(i, self.columns):
-                    self[j][k] += self[i][k] * mul    
+        """Turn given matrix into lower triangle state (elements below main diagonal are 0.0).
+        Rows are updated in processes of executor set by `set_executor` if matrix has more than PARALLEL_MIN_ROWS rows."""
+        if (Matrix._executor is None or self._rows <= PARALLEL_MIN_ROWS):
+            Matrix._lower_triangle(self, None)
+        else:
+            with parallel.SharedArray.from_array(self._data) as shared:
+                Matrix._lower_triangle(Matrix._from_array(shared.data, self._rows, self._columns), shared)
+                shared.copy_to(self._data)
+        self._version += 1
+    
+    @staticmethod
+    def _lower_triangle(mat, shared):
+        """[INTERNAL] turn given matrix into lower triangle state. Rows are updated in parallel if `shared` array (storage of `mat`) is given."""
+        Matrix._eliminate(mat, False, shared)
+    
+    def lu(self) -> LUDecomposition:
+        """Get LU decomposition of this matrix (only for square matrix).
+        Decomposition is cached and reused until this matrix changes."""
+        return self._cached("lu", lambda: LUDecomposition(self))
+    
+    def solve(self, b, cache: bool=True):
+        """Solve systems of linear equations with this matrix of coefficients (only for square matrix).
+        Matrix is decomposed once (see `lu`) and decomposition is reused for every right-hand side.
+        `b` - right-hand sides:
+        - Vector, list or tuple of numbers - returns Vector of results;
+        - Matrix - every column is right-hand side, returns Matrix with results in columns;
+        - list or tuple of Vectors/sequences - returns list of Vectors of results.
+        [cache] - whether to cache decomposition in this matrix to reuse it in next calls.
+        Raises ZeroDeterminantException if matrix is singular."""
+        lu = self.lu() if cache else LUDecomposition(self)
+        if (isinstance(b, Matrix)):
+            if (b.rows != self._rows):
+                raise ValueError("`b` must have row count equal to matrix row count!")
+            out = Matrix(b.columns, b.rows)
+            for j in range(b.columns):
+                out[j] = lu.solve(b._data[j::b.columns])
+            out.transpose()
+            return out
+        if (isinstance(b, (list, tuple, Vector))):
+            if (len(b) > 0 and isinstance(b[0], (list, tuple, Vector))):
+                return [lu.solve(vec) for vec in b]
+            return lu.solve(b)
+        raise TypeError("`b` must be a Matrix, Vector, list or tuple.")
     
     def get_determinant(self) -> float:
-        """Get determinant of this matrix (only for square matrix)."""
-        return Matrix.determinant(self)
+        """Get determinant of this matrix (only for square matrix). Determinant is cached until this matrix changes."""
+        return self._cached("determinant", lambda: Matrix.determinant(self))
+    
+    @property
+    def version(self) -> int:
+        """Get version of this matrix: number which is increased by every change of its elements or dimensions."""
+        return self._version
+    
+    def changed(self):
+        """Mark this matrix as changed: increase its version and so drop cached results (determinant, inverse, LU decomposition, rang).
+        Needed only after elements are written through `buffer`, `to_numpy` or other memoryview of storage, other changes are tracked automatically."""
+        self._version += 1
+    
+    def _cached(self, key, func):
+        """[INTERNAL] get result of `func()` cached by `key` until this matrix changes."""
+        if (self._cache_version != self._version):
+            self._cache.clear()
+            self._cache_version = self._version
+        if (key not in self._cache):
+            self._cache[key] = func()
+        return self._cache[key]
     
     def swap_rows(self, i1: int, i2: int):
         """Swap `i1`-th row and `i2`-th."""
-        self._mat[i1], self._mat[i2] = self._mat[i2], self._mat[i1]
+        s1 = range(self._rows)[i1] * self._columns
+        s2 = range(self._rows)[i2] * self._columns
+        c = self._columns
+        row = array("d", self._data[s1:s1 + c].tobytes())
+        self._data[s1:s1 + c] = self._data[s2:s2 + c]
+        self._data[s2:s2 + c] = row
+        self._version += 1
         
     def swap_columns(self, j1: int, j2: int):
         """Swap `j1`-th column and `j2`-th."""
-        for row in self._mat:
-            row[j1], row[j2] = row[j2], row[j1]
+        j1 = range(self._columns)[j1]
+        j2 = range(self._columns)[j2]
+        c = self._columns
+        self._data[j1::c], self._data[j2::c] = self._data[j2::c], self._data[j1::c]
+        self._version += 1
             
     def insert_row(self, vec: Vector, i: int):
         """Insert `vec` before `i`-th row."""
         if (len(vec) != self.columns):
             raise ValueError("`vec` must have length equal matrix column count!")
-        if (isinstance(vec, (list, tuple, Vector))):
-            if (not isinstance(vec, Vector)):
-                vec = Vector(vec)
-        else:
+        if (not isinstance(vec, (list, tuple, Vector))):
             raise TypeError("`vec` must be a list, tuple or Vector object.")
-        self._mat.insert(i, vec)
-        self._rows += 1
+        start = Matrix._insert_index(i, self._rows) * self._columns
+        data = self._data[:start] + array("d", vec) + self._data[start:]
+        self._set_storage(data, self._rows + 1, self._columns)
         
     def insert_column(self, vec: Vector, j: int):
         """Insert `vec` before `j`-th column."""
@@ -437,20 +889,28 @@ class Matrix():
             raise ValueError("`vec` must have length equal matrix row count!")
         if (not isinstance(vec, (list, tuple, Vector))):
             raise TypeError("`vec` must be a list, tuple or Vector object.")        
-        for i, row in enumerate(self._mat):
-            row.insert(j, vec[i])
-        self._columns += 1
+        j = Matrix._insert_index(j, self._columns)
+        d = self._data
+        c = self._columns
+        data = array("d")
+        for i in range(self._rows):
+            data += d[i * c:i * c + j]
+            data.append(vec[i])
+            data += d[i * c + j:(i + 1) * c]
+        self._set_storage(data, self._rows, c + 1)
         
     def remove_row(self, i: int):
         """Remove `i`-th row. Raises IndexError if given invalid index. Raises RuntimeError if matrix is empty."""
         if (self.rows > 0):
             try:
-                self._mat.pop(i)
-                self._rows -= 1
-                if (self._rows == 0):
-                    self._columns = 0
+                i = range(self._rows)[i]
             except IndexError:
                 raise IndexError("There's no row #{0} in matrix!".format(i))
+            c = self._columns
+            data = self._data[:i * c] + self._data[(i + 1) * c:]
+            if (self._rows == 1):
+                c = 0
+            self._set_storage(data, self._rows - 1, c)
         else:
             raise RuntimeError("Matrix is empty!")
         
@@ -458,45 +918,429 @@ class Matrix():
         """Remove `j`-th column. Raises IndexError if given invalid index. Raises RuntimeError if matrix is empty."""
         if (self.columns > 0):
             try:
-                for row in self._mat:
-                    row.pop(j)
-                self._columns -= 1
-                if (self._columns == 0):
-                    self._rows = 0
+                j = range(self._columns)[j]
             except IndexError:
                 raise IndexError("There's no column #{0} in matrix!".format(j))
+            d = self._data
+            c = self._columns
+            data = array("d")
+            for i in range(self._rows):
+                data += d[i * c:i * c + j]
+                data += d[i * c + j + 1:(i + 1) * c]
+            self._set_storage(data, self._rows if c > 1 else 0, c - 1)
         else:
             raise RuntimeError("Matrix is empty!")  
             
-    def rang(self) -> int:
-        """Get rang of this matrix."""
-        m = self.copy()
-        Matrix.to_lower_triangle(m)
-        rang = min(m.rows, m.columns)
-        for row in m._mat:
-            for e in row:
-                if (abs(e) > 0.00001):
-                    break
-            else:
-                rang -= 1
+    def rang(self, tolerance: float=None) -> int:
+        """Get rang of this matrix. Uses Gaussian elimination with row and column pivoting, which stops as soon as remaining submatrix is zero.
+        Rang is cached until this matrix changes.
+        [tolerance] - relative tolerance: elements with absolute value <= tolerance * (maximum absolute element of matrix) are considered zero,
+        by default - max(rows, columns) * machine epsilon."""
+        return self._cached(("rang", tolerance), lambda: self._rang(tolerance))
+    
+    def _rang(self, tolerance: float=None) -> int:
+        """[INTERNAL] calculate rang of this matrix (see `rang`)."""
+        threshold = self._threshold(tolerance)
+        c = self._columns
+        rows = [self._data[i * c:(i + 1) * c].tolist() for i in range(self._rows)]
+        rang = 0
+        while (rows):
+            maxes = [max(map(abs, row), default=0.0) for row in rows]
+            pivot_idx = max(range(len(rows)), key=maxes.__getitem__)
+            if (maxes[pivot_idx] <= threshold):
+                break
+            pivot_row = rows.pop(pivot_idx)
+            j = max(range(c), key=lambda k: abs(pivot_row[k]))
+            pivot = pivot_row[j]
+            for i, row in enumerate(rows):
+                if (row[j] != 0.0):
+                    factor = row[j] / pivot
+                    row = rows[i] = [a - b * factor for a, b in zip(row, pivot_row)]
+                    row[j] = 0.0
+            rang += 1
         return rang
     
-    def write(self, filepath: str):
-        """Write this matrix to binary file at given `filepath`."""
+    def nullity(self, tolerance: float=None) -> int:
+        """Get nullity of this matrix (dimension of its null space: column count - rang). See `rang` for [tolerance]."""
+        return self._columns - self.rang(tolerance)
+    
+    def row_echelon(self, tolerance: float=None):
+        """Get row echelon form of this matrix (Gaussian elimination with row pivoting, columns without non-zero pivot are skipped).
+        See `rang` for [tolerance], elements considered zero are set to 0.0."""
+        threshold = self._threshold(tolerance)
+        m = self.copy()
+        d = m._data
+        c = m._columns
+        i = 0
+        for j in range(c):
+            if (i >= m._rows):
+                break
+            column = d[i * c + j::c]
+            max_idx = max(range(len(column)), key=lambda k: abs(column[k]))
+            if (abs(column[max_idx]) <= threshold):
+                d[i * c + j::c] = array("d", [0.0]) * len(column)
+                continue
+            if (max_idx != 0):
+                m.swap_rows(i, i + max_idx)
+            pivot_row = d[i * c + j:(i + 1) * c]
+            for k in range(i + 1, m._rows):
+                start = k * c + j
+                if (d[start] != 0.0):
+                    factor = d[start] / pivot_row[0]
+                    d[start:(k + 1) * c] = array("d", [a - b * factor for a, b in zip(d[start:(k + 1) * c], pivot_row)])
+                    d[start] = 0.0
+            i += 1
+        return m
+    
+    def _threshold(self, tolerance: float=None) -> float:
+        """[INTERNAL] get absolute threshold for elements to be considered zero from relative `tolerance` (see `rang`)."""
+        if (tolerance is None):
+            tolerance = max(self._rows, self._columns) * float_info.epsilon
+        return tolerance * max(map(abs, self._data), default=0.0)
+    
+    def write(self, filepath: str, dtype: str="d"):
+        """Write this matrix to binary file at given `filepath`: header and elements in one bulk write.
+        [dtype] - type of written elements: "d" - double precision float, "f" - single precision float (smaller file, precision loss)."""
+        if (dtype not in ("d", "f")):
+            raise ValueError("`dtype` must be \"d\" or \"f\".")
         with open(filepath, "wb") as f:
-            f.write(pack("i", self.rows))
-            f.write(pack("i", self.columns))
-            for row in self._mat:
-                for e in row:
-                    f.write(pack("f", e))
+            f.write(pack(MATRIX_FILE_HEADER, MATRIX_FILE_MAGIC, MATRIX_FILE_VERSION, dtype.encode(), b"<" if byteorder == "little" else b">", self.rows, self.columns))
+            (self._data if dtype == "d" else array(dtype, self._data)).tofile(f)
                            
-    def read(self, filepath: str):
-        """Read matrix from binary file at given `filepath`."""
-        self.clear()
+    def read(self, filepath: str, mapped: bool=False):
+        """Read matrix from binary file at given `filepath` (written by `write`, files of old format without header are also supported).
+        [mapped] - True - map file to memory and copy elements straight from mapped pages, False - read elements with one bulk read."""
         with open(filepath, "rb") as f:
-            self.rows = unpack("i", f.read(calcsize("i")))[0]
-            self.columns = unpack("i", f.read(calcsize("i")))[0]
-            for i in range(self.rows):
-                for j in range(self.columns):
-                    self._mat[i][j] = unpack("f", f.read(calcsize("f")))[0]
+            dtype, order, rows, columns, offset = Matrix._read_header(f)
+            data = array(dtype, [0]) * (rows * columns)
+            size = len(data) * data.itemsize
+            if (mapped and size > 0):
+                with mmap(f.fileno(), 0, access=ACCESS_READ) as mm, memoryview(mm) as view:
+                    if (len(view) < offset + size):
+                        raise ValueError("Matrix file is truncated!")
+                    memoryview(data).cast("B")[:] = view[offset:offset + size]
+            else:
+                f.seek(offset)
+                if (f.readinto(memoryview(data).cast("B")) != size):
+                    raise ValueError("Matrix file is truncated!")
+        if (order != byteorder):
+            data.byteswap()
+        if (dtype != "d"):
+            data = array("d", data)
+        self._set_storage(data, rows, columns)
                     
+    @staticmethod
+    def map_file(filepath: str) -> memoryview:
+        """Map matrix file at given `filepath` to memory without reading it.
+        Returns read-only two-dimensional memoryview of its elements (one-dimensional if matrix is empty), pages of file are loaded on access.
+        Memoryview can be wrapped by NumPy (`numpy.asarray`) or copied into matrix with `read`.
+        Raises ValueError if elements of file have byte order different from this machine."""
+        with open(filepath, "rb") as f:
+            dtype, order, rows, columns, offset = Matrix._read_header(f)
+            if (order != byteorder):
+                raise ValueError("Matrix file has different byte order, it can be loaded only with `read`!")
+            mm = mmap(f.fileno(), 0, access=ACCESS_READ)
+        size = rows * columns * calcsize(dtype)
+        if (len(mm) < offset + size):
+            mm.close()
+            raise ValueError("Matrix file is truncated!")
+        view = memoryview(mm)[offset:offset + size].cast(dtype)
+        if (rows == 0 or columns == 0):
+            return view
+        return view.cast("B").cast(dtype, [rows, columns])
+    
+    @staticmethod
+    def _read_header(f) -> tuple:
+        """[INTERNAL] read header of opened matrix file: returns element type, byte order ("little" or "big"), rows, columns and offset of elements."""
+        raw = f.read(calcsize(MATRIX_FILE_HEADER))
+        if (raw[:len(MATRIX_FILE_MAGIC)] == MATRIX_FILE_MAGIC):
+            if (len(raw) < calcsize(MATRIX_FILE_HEADER)):
+                raise ValueError("Matrix file is truncated!")
+            magic, version, dtype, order, rows, columns = unpack(MATRIX_FILE_HEADER, raw)
+            if (version > MATRIX_FILE_VERSION):
+                raise ValueError("Matrix file version {0} is not supported!".format(version))
+            return dtype.decode(), "little" if order == b"<" else "big", rows, columns, len(raw)
+        if (len(raw) < calcsize("ii")):
+            raise ValueError("Matrix file is truncated!")
+        rows, columns = unpack("ii", raw[:calcsize("ii")])
+        return "f", byteorder, rows, columns, calcsize("ii")
+    
+    def to_csv(self, filepath: str, delimiter: str=",", fmt: str=None):
+        """Write this matrix to text file at given `filepath`: one row per line, elements are separated by `delimiter`.
+        [delimiter] - separator of elements, None - space;
+        [fmt] - format of elements ("%.6g" for example), by default - shortest representation which is read back exactly."""
+        separator = " " if delimiter is None else delimiter
+        c = self._columns
+        with open(filepath, "w") as f:
+            for i in range(self._rows):
+                row = self._data[i * c:(i + 1) * c]
+                f.write(separator.join(map(repr, row) if fmt is None else [fmt % e for e in row]) + "\n")
+    
+    @staticmethod
+    def from_csv(filepath: str, delimiter: str=",", skip: int=0, out=None, chunk_size: int=CSV_CHUNK_SIZE):
+        """Read matrix from text file at given `filepath` (one row per line, blank lines are ignored).
+        File is parsed by chunks, so whole text is never held in memory.
+        [delimiter] - separator of elements, None - any whitespace;
+        [skip] - count of lines to skip at beginning of file (header);
+        [out] - preallocated Matrix to read elements into (rows are streamed straight into its storage), its size must match the file;
+        [chunk_size] - count of characters parsed at once.
+        Returns new Matrix or `out`. Raises ValueError if file has wrong element or row with different count of elements."""
+        data = array("d") if out is None else out._data
+        if (out is not None):
+            out._version += 1
+        size = 0
+        columns = 0
+        for columns, values in Matrix._csv_chunks(filepath, delimiter, skip, chunk_size):
+            if (out is None):
+                data += values
+            else:
+                if (columns != out._columns or size + len(values) > len(data)):
+                    raise ValueError("Matrix file has more rows or different column count than `out` matrix!")
+                data[size:size + len(values)] = values
+            size += len(values)
+        if (out is None):
+            return Matrix._from_array(data, size // columns if columns else 0, columns)
+        if (size != len(data)):
+            raise ValueError("Matrix file has less rows than `out` matrix!")
+        return out
+    
+    @staticmethod
+    def iter_rows_csv(filepath: str, delimiter: str=",", skip: int=0, chunk_size: int=CSV_CHUNK_SIZE):
+        """Iterate rows of text matrix file at given `filepath` as Vectors without reading whole file (see `from_csv`)."""
+        for columns, values in Matrix._csv_chunks(filepath, delimiter, skip, chunk_size):
+            for start in range(0, len(values), columns):
+                yield Vector(values[start:start + columns])
+    
+    @staticmethod
+    def _csv_chunks(filepath: str, delimiter: str, skip: int, chunk_size: int):
+        """[INTERNAL] parse text matrix file by chunks: yields column count and array of elements of whole rows of every chunk."""
+        split = str.split if delimiter is None else lambda line: line.split(delimiter)
+        separator = " " if delimiter is None else delimiter
+        columns = None
+        number = 0
+        rest = ""
+        with open(filepath) as f:
+            while (True):
+                chunk = f.read(chunk_size)
+                text = rest + chunk
+                if (chunk):
+                    end = text.rfind("\n") + 1
+                    text, rest = text[:end], text[end:]
+                lines = text.splitlines()
+                if (skip > 0):
+                    skipped = min(skip, len(lines))
+                    lines = lines[skipped:]
+                    skip -= skipped
+                    number += skipped
+                rows = [line for line in lines if line.strip()]
+                if (rows):
+                    if (columns is None):
+                        columns = len(split(rows[0]))
+                    counts = map(len, map(str.split, rows)) if delimiter is None else (row.count(delimiter) + 1 for row in rows)
+                    if (any(count != columns for count in counts)):
+                        Matrix._csv_error(lines, number, split, columns)
+                    try:
+                        values = array("d", map(float, split(separator.join(rows))))
+                    except ValueError:
+                        values = None
+                    if (values is None or len(values) != len(rows) * columns):
+                        Matrix._csv_error(lines, number, split, columns)
+                    yield columns, values
+                number += len(lines)
+                if (not chunk):
+                    break
+    
+    @staticmethod
+    def _csv_error(lines: list, number: int, split, columns: int):
+        """[INTERNAL] find wrong line of text matrix file and raise ValueError about it. `number` - count of lines before given `lines`."""
+        for i, line in enumerate(lines, number + 1):
+            if (line.strip()):
+                values = split(line)
+                if (len(values) != columns):
+                    raise ValueError("Line {0} of matrix file has {1} elements instead of {2}!".format(i, len(values), columns))
+                try:
+                    list(map(float, values))
+                except ValueError as e:
+                    raise ValueError("Line {0} of matrix file has wrong element: {1}".format(i, e))
+        raise ValueError("Matrix file has wrong format!")
+
+class MatrixView():
+    """View of elements of a Matrix (transposed matrix, submatrix, minor) without copying them.
+    View shares storage with the matrix: changes of the matrix are visible through the view, rows of the view are copies of its elements.
+    Writing to the view (`view[i, j] = value`, `view[i] = row`, `view[i][j] = value`) first copies its elements into own matrix (copy-on-write), the matrix is not changed.
+    View is bound to positions in the matrix and is no longer valid after matrix is resized or its rows/columns are inserted or removed."""
+    def __init__(self, mat, row_offsets, column_offsets):
+        """Create a new MatrixView object over storage of matrix `mat`: element (i, j) of the view is `row_offsets[i] + column_offsets[j]`-th element of the storage."""
+        self._source = mat
+        self._row_offsets = row_offsets
+        self._column_offsets = column_offsets
+        self._own = False
+    
+    @staticmethod
+    def _offsets(mat) -> tuple:
+        """[INTERNAL] get source matrix, row offsets and column offsets of given matrix or view."""
+        if (isinstance(mat, MatrixView)):
+            return mat._source, mat._row_offsets, mat._column_offsets
+        step = max(mat.columns, 1)
+        return mat, range(0, mat.rows * step, step), range(mat.columns)
+    
+    @staticmethod
+    def _select(offsets, key):
+        """[INTERNAL] select offsets by index, slice or sequence of indices."""
+        if (isinstance(key, slice)):
+            return offsets[key]
+        if (isinstance(key, int)):
+            key = range(len(offsets))[key]
+            return offsets[key:key + 1]
+        return [offsets[k] for k in key]
+    
+    @property
+    def rows(self):
+        """Get row count of this view."""
+        return len(self._row_offsets)
+    
+    @property
+    def columns(self):
+        """Get column count of this view."""
+        return len(self._column_offsets)
+    
+    def __getitem__(self, key):
+        """Get element at (i, j) pos, view of rows and columns at (slice, slice) pos, row copy at `key` pos (MatrixViewRow). Slice gives list of rows."""
+        if (isinstance(key, tuple)):
+            i, j = key
+            if (isinstance(i, int) and isinstance(j, int)):
+                return self._source._data[self._row_offsets[i] + self._column_offsets[j]]
+            return SubmatrixView(self, i, j)
+        if (isinstance(key, slice)):
+            return [self[i] for i in range(*key.indices(self.rows))]
+        return MatrixViewRow(self, range(self.rows)[key])
+    
+    def __setitem__(self, key, value):
+        """Set element at (i, j) pos or row at `key` pos. View is copied into own matrix before the first write."""
+        self._materialize()
+        if (isinstance(key, tuple)):
+            i, j = key
+            self._source._data[self._row_offsets[i] + self._column_offsets[j]] = value
+        else:
+            self._source[key] = value
+    
+    def __iter__(self):
+        """Iterate through all elements of view."""
+        for i in range(self.rows):
+            yield from self._row(i)
+    
+    def __str__(self):
+        """String representaion of this view."""
+        return str(self.to_matrix())
+    
+    def __eq__(self, other):
+        """Whether view is equal to matrix or another view."""
+        if (not isinstance(other, (Matrix, MatrixView))):
+            raise TypeError("Only matrices can be compared!")
+        return self.rows == other.rows and self.columns == other.columns and list(self) == list(other)
+    
+    def __add__(self, other):
+        """Add matrix or number to view and return new matrix."""
+        return self.to_matrix() + (other.to_matrix() if isinstance(other, MatrixView) else other)
+    
+    def __radd__(self, other):
+        """Add view to matrix or number and return new matrix."""
+        return other + self.to_matrix()
+    
+    def __sub__(self, other):
+        """Subtract from view matrix or number and return new matrix."""
+        return self.to_matrix() - (other.to_matrix() if isinstance(other, MatrixView) else other)
+    
+    def __rsub__(self, other):
+        """Subtract view from matrix or number and return new matrix."""
+        return other - self.to_matrix()
+    
+    def __mul__(self, other):
+        """Multiply view by matrix, sequence or number (see `Matrix.__mul__`)."""
+        return self.to_matrix() * (other.to_matrix() if isinstance(other, MatrixView) else other)
+    
+    def __rmul__(self, other):
+        """Multiply matrix or number by view."""
+        return other * self.to_matrix()
+    
+    def __neg__(self):
+        """Return negative matrix to this view."""
+        return -self.to_matrix()
+    
+    def _row(self, i: int) -> array:
+        """[INTERNAL] get elements of `i`-th row of this view as array."""
+        data = self._source._data
+        base = self._row_offsets[i]
+        offsets = self._column_offsets
+        if (isinstance(offsets, range) and offsets.step > 0):
+            return data[base + offsets.start:base + offsets.stop:offsets.step]
+        return array("d", [data[base + c] for c in offsets])
+    
+    def _materialize(self):
+        """[INTERNAL] copy elements of this view into own matrix (done once, before the first write)."""
+        if (not self._own):
+            self._source, self._row_offsets, self._column_offsets = MatrixView._offsets(self.to_matrix())
+            self._own = True
+    
+    def to_matrix(self):
+        """Get elements of this view as a new Matrix."""
+        data = array("d")
+        for i in range(self.rows):
+            data += self._row(i)
+        return Matrix._from_array(data, self.rows, self.columns)
+    
+    copy = to_matrix
+    
+    def get_determinant(self) -> float:
+        """Get determinant of this view."""
+        return Matrix.determinant(self.to_matrix())
+    
+    def transposed_view(self):
+        """Get transposed view of this view."""
+        return TransposedView(self)
+    
+    def minor_view(self, i: int, j: int):
+        """Get view of this view without `i`-th row and `j`-th column."""
+        return MinorView(self, i, j)
+
+class TransposedView(MatrixView):
+    """Transposed view of a Matrix or another view (see MatrixView): element (i, j) of the view is element (j, i) of the matrix."""
+    def __init__(self, mat):
+        """Create a new TransposedView object of given matrix or view."""
+        source, row_offsets, column_offsets = MatrixView._offsets(mat)
+        super().__init__(source, column_offsets, row_offsets)
+
+class SubmatrixView(MatrixView):
+    """View of selected rows and columns of a Matrix or another view (see MatrixView)."""
+    def __init__(self, mat, rows, columns):
+        """Create a new SubmatrixView object of given matrix or view.
+        `rows`, `columns` - selected rows/columns: index, slice or sequence of indices."""
+        source, row_offsets, column_offsets = MatrixView._offsets(mat)
+        super().__init__(source, MatrixView._select(row_offsets, rows), MatrixView._select(column_offsets, columns))
+
+class MinorView(SubmatrixView):
+    """View of a Matrix or another view without one row and one column (see MatrixView)."""
+    def __init__(self, mat, i: int, j: int):
+        """Create a new MinorView object of given matrix or view without `i`-th row and `j`-th column."""
+        if ((i >= mat.rows or i < 0) or (j >= mat.columns or j < 0)):
+            raise IndexError
+        super().__init__(mat, [r for r in range(mat.rows) if r != i], [c for c in range(mat.columns) if c != j])
+
+class MatrixViewRow(Vector):
+    """Row of a MatrixView: copy of elements of the row, changing elements of the row changes the view (see MatrixView).
+    In-place operators change only the row, unless result is assigned back to the view (`view[i] += vec`).
+    Row has fixed length, methods that change it raise TypeError."""
+    def __init__(self, view: MatrixView, i: int):
+        """Create a new MatrixViewRow object of `i`-th row of given `view`."""
+        self._values = view._row(i).tolist()
+        self._view = view
+        self._i = i
+    
+    def __setitem__(self, key, value):
+        self._values[key] = value
+        if (isinstance(key, slice)):
+            self._view[self._i] = self._values
+        else:
+            self._view[self._i, key] = value
+    
+    clear = append = insert = extend = pop = MatrixRow._fixed_length
@@ -0,0 +1,108 @@
+"""Parallel execution of matrix operations in process pool (see `Matrix.set_executor`).
+Elements are passed to worker processes through shared memory blocks attached by name, so they're never pickled."""
+from array import array
+import os
+from sys import version_info
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+# Whether resource tracker of this process is shared with its parent process (Python < 3.13, see `_shared_tracker`), None - not known yet.
+_inherited_tracker = None
+
+def _shared_tracker() -> bool:
+    """[INTERNAL] whether shared memory blocks attached by this process are registered in resource tracker of process which created them.
+    Worker started after the creator's tracker is running inherits it, so the block is already registered there and must stay registered once.
+    Worker started before that (warm pool) runs its own tracker, which must forget attached blocks.
+    Decided once, before first attach (attaching starts own tracker if there's none yet)."""
+    global _inherited_tracker
+    if (_inherited_tracker is None):
+        _inherited_tracker = os.name != "posix" or resource_tracker._resource_tracker._fd is not None
+    return _inherited_tracker
+
+class SharedArray():
+    """Flat array of numbers (floats by default) in shared memory, other processes attach to it by its name.
+    Elements are accessed through `data` memoryview. Array must be closed after use (it's closed at exit from `with` block),
+    shared memory is freed when the process which created the array closes it."""
+    def __init__(self, length: int, name: str=None, typecode: str="d"):
+        """Create a new shared array of `length` numbers (all are 0) of type given by array `typecode`, or attach to existing shared array with given `name`."""
+        itemsize = array(typecode).itemsize
+        self._owner = name is None
+        if (self._owner):
+            self._shm = SharedMemory(create=True, size=max(length, 1) * itemsize)
+        elif (version_info >= (3, 13)):
+            self._shm = SharedMemory(name, track=False)
+        else:
+            shared_tracker = _shared_tracker()
+            self._shm = SharedMemory(name)
+            if (not shared_tracker):
+                # Python < 3.13 registers attached block in own resource tracker of this process as if it was created here, then tracker warns about leak and may unlink it early.
+                resource_tracker.unregister(self._shm._name, "shared_memory")
+        self._buffer = self._shm.buf.cast(typecode)
+        self.data = self._buffer[:length]
+    
+    @staticmethod
+    def from_array(data: array):
+        """Create a new shared array with copy of given array."""
+        out = SharedArray(len(data), typecode=data.typecode)
+        out.data[:] = memoryview(data)
+        return out
+    
+    @property
+    def name(self) -> str:
+        """Get name of shared memory block of this array."""
+        return self._shm.name
+    
+    def copy_to(self, data: array):
+        """Copy elements of this array to array of same length and type."""
+        memoryview(data)[:] = self.data
+    
+    def close(self):
+        """Close this array (and free its shared memory if it was created by this process)."""
+        self.data.release()
+        self._buffer.release()
+        self._shm.close()
+        if (self._owner):
+            self._shm.unlink()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+
+def run(executor, workers: int, task, start: int, stop: int, *args):
+    """Split range from `start` to `stop` into `workers` blocks, call `task(*args, block_start, block_stop)` for every block in `executor` and wait for all of them.
+    Exception raised by any task is raised again."""
+    step = max(1, -(-(stop - start) // workers))
+    futures = [executor.submit(task, *args, s, min(s + step, stop)) for s in range(start, stop, step)]
+    for future in futures:
+        future.result()
+
+def product(executor, workers: int, a: array, b: array, rows: int, columns: int, other_columns: int) -> array:
+    """Get flat storage of product of matrices with flat storages `a` (`rows` x `columns`) and `b` (`columns` x `other_columns`).
+    Blocks of rows of product are calculated in `executor`."""
+    with SharedArray.from_array(a) as sa, SharedArray.from_array(b) as sb, SharedArray(rows * other_columns) as out:
+        run(executor, workers, _product_task, 0, rows, sa.name, sb.name, out.name, rows, columns, other_columns)
+        data = array("d", [0.0]) * (rows * other_columns)
+        out.copy_to(data)
+    return data
+
+def _product_task(a_name: str, b_name: str, out_name: str, rows: int, columns: int, other_columns: int, start: int, stop: int):
+    """[INTERNAL] calculate rows from `start` to `stop` of product of shared matrices (see `product`)."""
+    from matrix import Matrix
+    with SharedArray(rows * columns, a_name) as a, SharedArray(columns * other_columns, b_name) as b, SharedArray(rows * other_columns, out_name) as out:
+        Matrix._product_rows(a.data, b.data, out.data, columns, other_columns, start, stop)
+
+def _update_task(name: str, factors_name: str, rows: int, columns: int, k: int, stop_pivot: int, lu: bool, width: int, start: int, stop: int):
+    """[INTERNAL] apply eliminations by panel of pivot rows to rows from `start` to `stop` of shared matrix (see `Matrix._eliminate`)."""
+    from matrix import Matrix
+    with SharedArray(rows * columns, name) as d, SharedArray(rows * width, factors_name) as factors:
+        Matrix._update_rows(d.data, columns, k, stop_pivot, lu, factors.data, width, start, stop)
+
+def _all_pairs_task(vertices: int, edges: int, indptr_name: str, indices_name: str, weights_name: str, distances_name: str, hops_name: str, start: int, stop: int):
+    """[INTERNAL] find shortest paths from vertices from `start` to `stop` to all vertices of shared graph in compressed sparse row format
+    and write them to shared table (see `Graph.all_pairs`)."""
+    from graph import Graph
+    with SharedArray(vertices + 1, indptr_name, "q") as indptr, SharedArray(edges, indices_name, "i") as indices, SharedArray(edges, weights_name) as weights:
+        with SharedArray(vertices * vertices, distances_name) as distances, SharedArray(vertices * vertices, hops_name, "i") as hops:
+            Graph._all_pairs_rows(indptr.data, indices.data, weights.data, distances.data, hops.data, start, stop)
@@ -1,5 +1,6 @@
 from vector import Vector
 from matrix import Matrix
+from sparsematrix import SparseMatrix
 
 class Place:
     """A place in Petri net.
@@ -431,7 +432,7 @@ class PetriNet:
             else:
                 raise TypeError("`transitions` must be a list/tuple of Transition object or string names of transitions in this net.")
             sig = Vector(count)
-            return self.incidence() * sig + Vector([p.tokens for p in self._places])
+            return self.incidence(sparse=True) * sig + Vector([p.tokens for p in self._places])
         return [p.tokens for p in self._places]
     
     def set_tokens(self, place: [Place, str], tokens: int):
@@ -459,8 +460,22 @@ class PetriNet:
         else:
             raise TypeError("`marking` must be a list/tuple of ints.")
                 
-    def incidence(self):
-        """Get incidence matrix of this net."""
+    def incidence(self, sparse: bool=False):
+        """Get incidence matrix of this net.
+        [sparse] - True - get SparseMatrix built directly from arcs of transitions, False - get Matrix."""
+        if (sparse):
+            idx = {p: j for j, p in enumerate(self._places)}
+            entries = []
+            for i, t in enumerate(self._transitions):
+                # Only first arc entry of every place counts (as in `input_arc_count` and `output_arc_count`).
+                inputs = {}
+                outputs = {}
+                for p, arcs in t._inputs:
+                    inputs.setdefault(p, arcs)
+                for p, arcs in t._outputs:
+                    outputs.setdefault(p, arcs)
+                entries.extend((i, idx[p], outputs.get(p, 0) - inputs.get(p, 0)) for p in set(inputs) | set(outputs) if p in idx)
+            return SparseMatrix.from_coo(len(self._transitions), len(self._places), entries)
         mat = Matrix(len(self._transitions), len(self._places))
         for i, t in enumerate(self._transitions):
             for j, p in enumerate(self._places):
@@ -0,0 +1,158 @@
+"""Iterative solvers of systems of linear equations A*x = b with square coefficient matrix A (Matrix or SparseMatrix).
+Solvers keep only rows of A (O(nnz) memory for SparseMatrix) and few vectors, and stop when relative residual |b - A*x| / |b| <= tolerance."""
+from math import sqrt
+from operator import add, sub, mul, truediv
+from itertools import repeat
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from vector import Vector
+from matrix import Matrix, WrongDimensionsException
+from sparsematrix import SparseMatrix
+
+# Default relative tolerance of residual.
+SOLVER_TOLERANCE = 1e-8
+# Default maximal count of iterations.
+SOLVER_MAX_ITERATIONS = 1000
+# Products of coefficient matrix with vectors are calculated with NumPy when it's available and system has at least this count of unknowns.
+NUMPY_MIN_UNKNOWNS = 256
+
+class SolverResult():
+    """Result of iterative solver.
+    `x`: Vector - solution (last iterate);
+    `converged`: bool - whether residual reached tolerance;
+    `iterations`: int - count of performed iterations;
+    `residuals`: list - norm of residual |b - A*x| of initial guess and of iterate after every iteration."""
+    def __init__(self, x: Vector, converged: bool, iterations: int, residuals: list):
+        self.x = x
+        self.converged = converged
+        self.iterations = iterations
+        self.residuals = residuals
+    
+    def __str__(self):
+        return "SolverResult(converged={0}, iterations={1}, residual={2})".format(self.converged, self.iterations, self.residuals[-1])
+
+class _Coefficients():
+    """[INTERNAL] square coefficient matrix prepared for iterative solvers: rows as (column indices or None for all columns, values), diagonal and products with vectors."""
+    def __init__(self, a):
+        if (not isinstance(a, (Matrix, SparseMatrix))):
+            raise TypeError("`a` must be a Matrix or SparseMatrix.")
+        if (a.rows != a.columns):
+            raise WrongDimensionsException("Matrix must be square to solve system of linear equations!")
+        n = self.n = a.rows
+        self._arrays = None
+        if (isinstance(a, SparseMatrix)):
+            ptr = a._indptr
+            self.rows = [(a._indices[ptr[i]:ptr[i + 1]], a._values[ptr[i]:ptr[i + 1]]) for i in range(n)]
+            self.diagonal = [dict(zip(*row)).get(i, 0.0) for i, row in enumerate(self.rows)]
+            if (numpy is not None and n >= NUMPY_MIN_UNKNOWNS):
+                counts = numpy.diff(numpy.frombuffer(ptr, dtype=numpy.int64))
+                self._arrays = (numpy.repeat(numpy.arange(n), counts), numpy.frombuffer(a._indices, dtype=numpy.int64), numpy.frombuffer(a._values))
+        else:
+            data = memoryview(a._data)
+            self.rows = [(None, data[i * n:(i + 1) * n]) for i in range(n)]
+            self.diagonal = a._data[::n + 1].tolist()
+            if (numpy is not None and n >= NUMPY_MIN_UNKNOWNS):
+                self._arrays = numpy.frombuffer(a._data).reshape(n, n)
+    
+    def product(self, x: list) -> list:
+        """Get product A*x."""
+        if (self._arrays is None):
+            return [sum(map(mul, values, x if indices is None else map(x.__getitem__, indices))) for indices, values in self.rows]
+        if (isinstance(self._arrays, tuple)):
+            rows, columns, values = self._arrays
+            return numpy.bincount(rows, weights=values * numpy.asarray(x)[columns], minlength=self.n).tolist()
+        return (self._arrays @ numpy.asarray(x)).tolist()
+    
+    def check_diagonal(self):
+        """Raise ValueError if diagonal has zero element."""
+        if (0.0 in self.diagonal):
+            raise ValueError("Matrix must have non-zero elements on main diagonal!")
+
+def _norm(x: list) -> float:
+    """[INTERNAL] get Euclidean norm of vector."""
+    return sqrt(sum(map(mul, x, x)))
+
+def _start(a, b, x0):
+    """[INTERNAL] prepare solver: get coefficients, right-hand side and initial guess as lists."""
+    coefficients = _Coefficients(a)
+    if (len(b) != coefficients.n):
+        raise ValueError("`b` must have length equal to matrix row count!")
+    if (x0 is not None and len(x0) != coefficients.n):
+        raise ValueError("`x0` must have length equal to matrix row count!")
+    return coefficients, [float(e) for e in b], [0.0] * coefficients.n if x0 is None else [float(e) for e in x0]
+
+def _step(residuals: list, residual: float, threshold: float, callback, iteration: int, x: list) -> bool:
+    """[INTERNAL] record residual of iterate and call callback. Returns whether solver must stop."""
+    residuals.append(residual)
+    if (callback is not None and callback(iteration, Vector(x), residual)):
+        return True
+    return residual <= threshold
+
+def conjugate_gradient(a, b, x0=None, tolerance: float=SOLVER_TOLERANCE, max_iter: int=SOLVER_MAX_ITERATIONS, callback=None) -> SolverResult:
+    """Solve system A*x = b with conjugate gradient method (A must be symmetric positive-definite).
+    `a` - Matrix or SparseMatrix;
+    `b` - right-hand side (Vector or sequence of numbers);
+    [x0] - initial guess, zero vector by default;
+    [tolerance] - relative tolerance of residual: iterations stop when |b - A*x| <= tolerance * |b|;
+    [max_iter] - maximal count of iterations;
+    [callback] - function called after every iteration with iteration number, iterate (Vector) and residual norm, iterations stop if it returns True."""
+    coefficients, b, x = _start(a, b, x0)
+    threshold = tolerance * _norm(b)
+    r = list(map(sub, b, coefficients.product(x)))
+    p = r[:]
+    rr = sum(map(mul, r, r))
+    residuals = [sqrt(rr)]
+    iteration = 0
+    stop = residuals[0] <= threshold
+    while (not stop and iteration < max_iter):
+        iteration += 1
+        ap = coefficients.product(p)
+        pap = sum(map(mul, p, ap))
+        if (pap == 0.0):
+            break
+        alpha = rr / pap
+        x = list(map(add, x, map(mul, p, repeat(alpha))))
+        r = list(map(sub, r, map(mul, ap, repeat(alpha))))
+        rr_next = sum(map(mul, r, r))
+        p = list(map(add, r, map(mul, p, repeat(rr_next / rr))))
+        rr = rr_next
+        stop = _step(residuals, sqrt(rr), threshold, callback, iteration, x)
+    return SolverResult(Vector(x), residuals[-1] <= threshold, iteration, residuals)
+
+def jacobi(a, b, x0=None, tolerance: float=SOLVER_TOLERANCE, max_iter: int=SOLVER_MAX_ITERATIONS, callback=None) -> SolverResult:
+    """Solve system A*x = b with Jacobi method (converges for diagonally dominant A). See `conjugate_gradient` for arguments.
+    Raises ValueError if A has zero on main diagonal."""
+    coefficients, b, x = _start(a, b, x0)
+    coefficients.check_diagonal()
+    threshold = tolerance * _norm(b)
+    r = list(map(sub, b, coefficients.product(x)))
+    residuals = [_norm(r)]
+    iteration = 0
+    stop = residuals[0] <= threshold
+    while (not stop and iteration < max_iter):
+        iteration += 1
+        x = list(map(add, x, map(truediv, r, coefficients.diagonal)))
+        r = list(map(sub, b, coefficients.product(x)))
+        stop = _step(residuals, _norm(r), threshold, callback, iteration, x)
+    return SolverResult(Vector(x), residuals[-1] <= threshold, iteration, residuals)
+
+def gauss_seidel(a, b, x0=None, tolerance: float=SOLVER_TOLERANCE, max_iter: int=SOLVER_MAX_ITERATIONS, callback=None) -> SolverResult:
+    """Solve system A*x = b with Gauss-Seidel method (converges for diagonally dominant or symmetric positive-definite A). See `conjugate_gradient` for arguments.
+    Raises ValueError if A has zero on main diagonal."""
+    coefficients, b, x = _start(a, b, x0)
+    coefficients.check_diagonal()
+    threshold = tolerance * _norm(b)
+    residuals = [_norm(list(map(sub, b, coefficients.product(x))))]
+    iteration = 0
+    stop = residuals[0] <= threshold
+    diagonal = coefficients.diagonal
+    while (not stop and iteration < max_iter):
+        iteration += 1
+        for i, (indices, values) in enumerate(coefficients.rows):
+            x[i] += (b[i] - sum(map(mul, values, x if indices is None else map(x.__getitem__, indices)))) / diagonal[i]
+        stop = _step(residuals, _norm(list(map(sub, b, coefficients.product(x)))), threshold, callback, iteration, x)
+    return SolverResult(Vector(x), residuals[-1] <= threshold, iteration, residuals)
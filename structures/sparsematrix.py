@@ -0,0 +1,394 @@
+from array import array
+from bisect import bisect_left
+from numbers import Real
+
+from vector import Vector
+from matrix import Matrix, WrongDimensionsException
+
+class SparseMatrix():
+    """Class representing mathematical Matrix with mostly zero elements.
+    Only non-zero elements are stored in CSR (compressed sparse row) format:
+    `_values` - non-zero elements row by row, `_indices` - their column indices (sorted in every row),
+    `_indptr` - i-th row elements are `_values[_indptr[i]:_indptr[i + 1]]`.
+    Elements are accessed by `mat[i, j]`."""
+    def __init__(self, rows: int, columns: int):
+        """Create a new SparseMatrix object filled with zeros. `rows` - count of rows in this matrix, `columns` - count of columns in this matrix."""
+        if (rows < 0 or columns < 0):
+            raise ValueError("Matrix cannot have negative dimensions!")
+        self._rows = rows
+        self._columns = columns
+        self._indptr = array("q", [0]) * (rows + 1)
+        self._indices = array("q")
+        self._values = array("d")
+    
+    @property
+    def rows(self) -> int:
+        """Get row count of this matrix."""
+        return self._rows
+    
+    @property
+    def columns(self) -> int:
+        """Get column count of this matrix."""
+        return self._columns
+    
+    @property
+    def nnz(self) -> int:
+        """Get count of stored (non-zero) elements."""
+        return len(self._values)
+    
+    @staticmethod
+    def from_coo(rows: int, columns: int, entries):
+        """Create and return a new SparseMatrix from COO entries.
+        `entries` - iterable of (i, j, value) triples, values of repeated positions are summed, zero results are not stored."""
+        summed = {}
+        for i, j, value in entries:
+            if (not (0 <= i < rows and 0 <= j < columns)):
+                raise IndexError("Element ({0}, {1}) is out of matrix!".format(i, j))
+            summed[i, j] = summed.get((i, j), 0.0) + value
+        m = SparseMatrix(rows, columns)
+        counts = [0] * rows
+        for (i, j), value in sorted(summed.items()):
+            if (value != 0.0):
+                m._indices.append(j)
+                m._values.append(value)
+                counts[i] += 1
+        for i, count in enumerate(counts):
+            m._indptr[i + 1] = m._indptr[i] + count
+        return m
+    
+    @staticmethod
+    def from_matrix(mat: Matrix):
+        """Create and return a new SparseMatrix with same elements as given Matrix."""
+        m = SparseMatrix(mat.rows, mat.columns)
+        d = mat._data
+        c = mat.columns
+        for i in range(mat.rows):
+            for j, e in enumerate(d[i * c:(i + 1) * c]):
+                if (e != 0.0):
+                    m._indices.append(j)
+                    m._values.append(e)
+            m._indptr[i + 1] = len(m._values)
+        return m
+    
+    def _find(self, i: int, j: int) -> int:
+        """[INTERNAL] get position of (`i`, `j`) element in storage or -1 if it's zero. Raises IndexError if position is out of matrix."""
+        if (not (0 <= i < self._rows and 0 <= j < self._columns)):
+            raise IndexError("Element ({0}, {1}) is out of matrix!".format(i, j))
+        start = self._indptr[i]
+        end = self._indptr[i + 1]
+        pos = bisect_left(self._indices, j, start, end)
+        if (pos < end and self._indices[pos] == j):
+            return pos
+        return -1
+    
+    def _set_storage(self, indptr: array, indices: array, values: array, rows: int, columns: int):
+        """[INTERNAL] set CSR storage and dimensions of this matrix."""
+        self._indptr = indptr
+        self._indices = indices
+        self._values = values
+        self._rows = rows
+        self._columns = columns
+    
+    def __getitem__(self, key):
+        """Get element at `key` = (i, j) position."""
+        i, j = key
+        pos = self._find(i, j)
+        return self._values[pos] if pos != -1 else 0.0
+    
+    def __setitem__(self, key, value: float):
+        """Set element at `key` = (i, j) position. Setting zero removes element from storage."""
+        i, j = key
+        pos = self._find(i, j)
+        if (pos != -1):
+            if (value != 0.0):
+                self._values[pos] = value
+                return
+            self._indices.pop(pos)
+            self._values.pop(pos)
+            shift = -1
+        elif (value != 0.0):
+            pos = bisect_left(self._indices, j, self._indptr[i], self._indptr[i + 1])
+            self._indices.insert(pos, j)
+            self._values.insert(pos, value)
+            shift = 1
+        else:
+            return
+        for k in range(i + 1, self._rows + 1):
+            self._indptr[k] += shift
+    
+    def __iter__(self):
+        """Iterate through all elements of matrix (including zeros)."""
+        for i in range(self._rows):
+            row = [0.0] * self._columns
+            for k in range(self._indptr[i], self._indptr[i + 1]):
+                row[self._indices[k]] = self._values[k]
+            yield from row
+    
+    def __str__(self):
+        """String representaion of this matrix."""
+        out = "SparseMatrix({0}x{1}".format(self._rows, self._columns)
+        for i, j, e in self.items():
+            out += ", ({0}, {1}): {2:.2f}".format(i, j, e)
+        return out + ")"
+    
+    def __eq__(self, other):
+        """Whether two matrices are equal."""
+        if (not isinstance(other, SparseMatrix)):
+            raise TypeError("Only sparse matrices can be compared!")
+        return (self._rows == other._rows and self._columns == other._columns and self._indptr == other._indptr
+                and self._indices == other._indices and self._values == other._values)
+    
+    def __add__(self, other):
+        """Add sparse matrix (result is SparseMatrix) or Matrix (result is Matrix) to this matrix and return it."""
+        return self._combine(other, 1.0)
+    
+    def __radd__(self, other):
+        """Add this matrix to Matrix and return result."""
+        return self._combine(other, 1.0)
+    
+    def __sub__(self, other):
+        """Subtract from this matrix sparse matrix (result is SparseMatrix) or Matrix (result is Matrix) and return it."""
+        return self._combine(other, -1.0)
+    
+    def __rsub__(self, other):
+        """Subtract this matrix from Matrix and return result."""
+        return (-self)._combine(other, 1.0)
+    
+    def __neg__(self):
+        """Return negative matrix to current (negate every element)."""
+        m = self.copy()
+        m._values = array("d", [-e for e in self._values])
+        return m
+    
+    def __mul__(self, other):
+        """Multiply matrix by SparseMatrix (result is SparseMatrix), Matrix (result is Matrix), sequence (result is Vector) or number.
+        Sequence is multiplied same way as by Matrix: it must have length equal to row count, result has length equal to column count."""
+        if (isinstance(other, (list, tuple, Vector))):
+            if (self._rows != len(other)):
+                raise ValueError("`other` must have length equal to matrix row count.")
+            result = [0.0] * self._columns
+            for i, o in enumerate(other):
+                if (o != 0.0):
+                    for k in range(self._indptr[i], self._indptr[i + 1]):
+                        result[self._indices[k]] += self._values[k] * o
+            return Vector(result)
+        if (isinstance(other, SparseMatrix)):
+            if (self._columns != other._rows):
+                raise WrongDimensionsException("First matrix must have column count equal to second matrix's row count to perform this operation!")
+            m = SparseMatrix(self._rows, other._columns)
+            for i in range(self._rows):
+                acc = {}
+                for k in range(self._indptr[i], self._indptr[i + 1]):
+                    a = self._values[k]
+                    row = self._indices[k]
+                    for p in range(other._indptr[row], other._indptr[row + 1]):
+                        j = other._indices[p]
+                        acc[j] = acc.get(j, 0.0) + a * other._values[p]
+                for j in sorted(acc):
+                    if (acc[j] != 0.0):
+                        m._indices.append(j)
+                        m._values.append(acc[j])
+                m._indptr[i + 1] = len(m._values)
+            return m
+        if (isinstance(other, Matrix)):
+            if (self._columns != other.rows):
+                raise WrongDimensionsException("First matrix must have column count equal to second matrix's row count to perform this operation!")
+            oc = other.columns
+            od = other._data
+            data = array("d")
+            for i in range(self._rows):
+                acc = [0.0] * oc
+                for k in range(self._indptr[i], self._indptr[i + 1]):
+                    a = self._values[k]
+                    start = self._indices[k] * oc
+                    acc = [x + a * y for x, y in zip(acc, od[start:start + oc])]
+                data.extend(acc)
+            return Matrix._from_array(data, self._rows, oc)
+        if (isinstance(other, Real)):
+            other = float(other)
+            if (other == 0):
+                return SparseMatrix(self._rows, self._columns)
+            m = self.copy()
+            m._values = array("d", [e * other for e in self._values])
+            return m
+        return NotImplemented
+    
+    def __rmul__(self, other):
+        """Multiply Matrix (result is Matrix) or number by this matrix."""
+        if (isinstance(other, Matrix)):
+            if (other.columns != self._rows):
+                raise WrongDimensionsException("First matrix must have column count equal to second matrix's row count to perform this operation!")
+            c = other.columns
+            d = other._data
+            data = array("d")
+            for i in range(other.rows):
+                acc = [0.0] * self._columns
+                for k, a in enumerate(d[i * c:(i + 1) * c]):
+                    if (a != 0.0):
+                        for p in range(self._indptr[k], self._indptr[k + 1]):
+                            acc[self._indices[p]] += a * self._values[p]
+                data.extend(acc)
+            return Matrix._from_array(data, other.rows, self._columns)
+        if (isinstance(other, Real)):
+            return self * other
+        return NotImplemented
+    
+    def _combine(self, other, factor: float):
+        """[INTERNAL] get sum of this matrix and `other` multiplied by `factor`."""
+        if (not isinstance(other, (SparseMatrix, Matrix))):
+            return NotImplemented
+        if ((self._rows != other.rows) or (self._columns != other.columns)):
+            raise WrongDimensionsException("Matrices must have equal size to perform this operation!")
+        if (isinstance(other, Matrix)):
+            m = other * factor
+            for i, j, e in self.items():
+                m._data[i * self._columns + j] += e
+            return m
+        m = SparseMatrix(self._rows, self._columns)
+        for i in range(self._rows):
+            acc = {}
+            for k in range(self._indptr[i], self._indptr[i + 1]):
+                acc[self._indices[k]] = self._values[k]
+            for k in range(other._indptr[i], other._indptr[i + 1]):
+                j = other._indices[k]
+                acc[j] = acc.get(j, 0.0) + other._values[k] * factor
+            for j in sorted(acc):
+                if (acc[j] != 0.0):
+                    m._indices.append(j)
+                    m._values.append(acc[j])
+            m._indptr[i + 1] = len(m._values)
+        return m
+    
+    def items(self):
+        """Iterate through non-zero elements of matrix: yields (i, j, value) triples row by row."""
+        for i in range(self._rows):
+            for k in range(self._indptr[i], self._indptr[i + 1]):
+                yield (i, self._indices[k], self._values[k])
+    
+    def row(self, i: int) -> Vector:
+        """Get copy of `i`-th row as Vector."""
+        i = range(self._rows)[i]
+        row = [0.0] * self._columns
+        for k in range(self._indptr[i], self._indptr[i + 1]):
+            row[self._indices[k]] = self._values[k]
+        return Vector(row)
+    
+    def to_matrix(self) -> Matrix:
+        """Get Matrix with same elements as this matrix."""
+        m = Matrix(self._rows, self._columns)
+        for i, j, e in self.items():
+            m._data[i * self._columns + j] = e
+        return m
+    
+    def clear(self):
+        """Clear this matrix."""
+        self._set_storage(array("q", [0]), array("q"), array("d"), 0, 0)
+    
+    def copy(self):
+        """Return a copy of this matrix."""
+        m = SparseMatrix(0, 0)
+        m._set_storage(self._indptr[:], self._indices[:], self._values[:], self._rows, self._columns)
+        return m
+    
+    def transpose(self):
+        """Transpose this matrix (turn rows into columns and vice versa.)."""
+        indptr = array("q", [0]) * (self._columns + 1)
+        for j in self._indices:
+            indptr[j + 1] += 1
+        for j in range(self._columns):
+            indptr[j + 1] += indptr[j]
+        nxt = indptr[:-1]
+        indices = array("q", [0]) * len(self._indices)
+        values = array("d", [0.0]) * len(self._values)
+        for i in range(self._rows):
+            for k in range(self._indptr[i], self._indptr[i + 1]):
+                j = self._indices[k]
+                pos = nxt[j]
+                indices[pos] = i
+                values[pos] = self._values[k]
+                nxt[j] += 1
+        self._set_storage(indptr, indices, values, self._columns, self._rows)
+    
+    def transposed(self):
+        """Get transposed version of this matrix."""
+        m = self.copy()
+        m.transpose()
+        return m
+    
+    def insert_row(self, vec: Vector, i: int):
+        """Insert `vec` before `i`-th row."""
+        if (len(vec) != self._columns):
+            raise ValueError("`vec` must have length equal matrix column count!")
+        if (not isinstance(vec, (list, tuple, Vector))):
+            raise TypeError("`vec` must be a list, tuple or Vector object.")
+        i = Matrix._insert_index(i, self._rows)
+        nonzero = [(j, e) for j, e in enumerate(vec) if e != 0.0]
+        pos = self._indptr[i]
+        indices = self._indices[:pos] + array("q", [j for j, e in nonzero]) + self._indices[pos:]
+        values = self._values[:pos] + array("d", [e for j, e in nonzero]) + self._values[pos:]
+        indptr = self._indptr[:i + 1] + array("q", [p + len(nonzero) for p in self._indptr[i:]])
+        self._set_storage(indptr, indices, values, self._rows + 1, self._columns)
+    
+    def insert_column(self, vec: Vector, j: int):
+        """Insert `vec` before `j`-th column."""
+        if (len(vec) != self._rows):
+            raise ValueError("`vec` must have length equal matrix row count!")
+        if (not isinstance(vec, (list, tuple, Vector))):
+            raise TypeError("`vec` must be a list, tuple or Vector object.")
+        j = Matrix._insert_index(j, self._columns)
+        indptr = array("q", [0])
+        indices = array("q")
+        values = array("d")
+        for i in range(self._rows):
+            start = self._indptr[i]
+            end = self._indptr[i + 1]
+            pos = bisect_left(self._indices, j, start, end)
+            indices += self._indices[start:pos]
+            values += self._values[start:pos]
+            if (vec[i] != 0.0):
+                indices.append(j)
+                values.append(vec[i])
+            indices.extend(k + 1 for k in self._indices[pos:end])
+            values += self._values[pos:end]
+            indptr.append(len(values))
+        self._set_storage(indptr, indices, values, self._rows, self._columns + 1)
+    
+    def remove_row(self, i: int):
+        """Remove `i`-th row. Raises IndexError if given invalid index. Raises RuntimeError if matrix is empty."""
+        if (self._rows > 0):
+            try:
+                i = range(self._rows)[i]
+            except IndexError:
+                raise IndexError("There's no row #{0} in matrix!".format(i))
+            start = self._indptr[i]
+            end = self._indptr[i + 1]
+            indptr = self._indptr[:i + 1] + array("q", [p - (end - start) for p in self._indptr[i + 2:]])
+            indices = self._indices[:start] + self._indices[end:]
+            values = self._values[:start] + self._values[end:]
+            self._set_storage(indptr, indices, values, self._rows - 1, self._columns if self._rows > 1 else 0)
+        else:
+            raise RuntimeError("Matrix is empty!")
+    
+    def remove_column(self, j: int):
+        """Remove `j`-th column. Raises IndexError if given invalid index. Raises RuntimeError if matrix is empty."""
+        if (self._columns > 0):
+            try:
+                j = range(self._columns)[j]
+            except IndexError:
+                raise IndexError("There's no column #{0} in matrix!".format(j))
+            if (self._columns == 1):
+                self.clear()
+                return
+            indptr = array("q", [0])
+            indices = array("q")
+            values = array("d")
+            for i in range(self._rows):
+                for k in range(self._indptr[i], self._indptr[i + 1]):
+                    col = self._indices[k]
+                    if (col != j):
+                        indices.append(col - 1 if col > j else col)
+                        values.append(self._values[k])
+                indptr.append(len(values))
+            self._set_storage(indptr, indices, values, self._rows, self._columns - 1)
+        else:
+            raise RuntimeError("Matrix is empty!")
@@ -0,0 +1,277 @@
+from array import array
+from math import sin, cos, radians
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from matrix import Matrix, ZeroDeterminantException, WrongDimensionsException
+from vector import Vector2, Vector3
+
+# Point buffers with at least this count of points are transformed with NumPy when it's available.
+NUMPY_MIN_POINTS = 256
+
+def _point_buffer(points) -> array:
+    """[INTERNAL] get flat coordinates as float buffer (array or memoryview are used as is)."""
+    if (isinstance(points, (array, memoryview))):
+        return points
+    return array("d", points)
+
+class Transform2D():
+    """Affine transform of 2d space: 3x3 matrix with last row (0, 0, 1).
+    `m00`, `m01`, `m10`, `m11` - linear part, `m02`, `m12` - translation."""
+    __slots__ = ("m00", "m01", "m02", "m10", "m11", "m12")
+    
+    def __init__(self, m00: float=1.0, m01: float=0.0, m02: float=0.0, m10: float=0.0, m11: float=1.0, m12: float=0.0):
+        """Create a new Transform2D object from elements of first two rows of its matrix (identity by default)."""
+        self.m00 = m00
+        self.m01 = m01
+        self.m02 = m02
+        self.m10 = m10
+        self.m11 = m11
+        self.m12 = m12
+    
+    @staticmethod
+    def translation(dx: float, dy: float):
+        """Make translation transform (same as Matrix.make_translation)."""
+        return Transform2D(1.0, 0.0, dx, 0.0, 1.0, dy)
+    
+    @staticmethod
+    def rotation(angle: float):
+        """Make rotation transform by `angle` in degrees counterclockwise."""
+        s = sin(radians(angle))
+        c = cos(radians(angle))
+        return Transform2D(c, -s, 0.0, s, c, 0.0)
+    
+    @staticmethod
+    def scale(x: float, y: float):
+        """Make scale transform (same as Matrix.make_scale)."""
+        return Transform2D(x, 0.0, 0.0, 0.0, y, 0.0)
+    
+    @staticmethod
+    def from_matrix(mat: Matrix):
+        """Create a new Transform2D object from 3x3 Matrix (last row is ignored)."""
+        if (mat.rows != 3 or mat.columns != 3):
+            raise WrongDimensionsException("Matrix must be 3x3 to make 2d transform!")
+        return Transform2D(*mat._data[:6])
+    
+    def __eq__(self, other):
+        """Whether two transforms are equal."""
+        if (not isinstance(other, Transform2D)):
+            raise TypeError("Only transforms can be compared!")
+        return (self.m00, self.m01, self.m02, self.m10, self.m11, self.m12) == (other.m00, other.m01, other.m02, other.m10, other.m11, other.m12)
+    
+    def __str__(self):
+        """String representaion of this transform."""
+        return "Transform2D(%.2f %.2f %.2f, %.2f %.2f %.2f)" % (self.m00, self.m01, self.m02, self.m10, self.m11, self.m12)
+    
+    def __mul__(self, other):
+        """Compose this transform with another (`other` is applied first, then this) or transform point (x, y) and return it.
+        Point given as Vector2 gives Vector2, otherwise tuple."""
+        if (isinstance(other, Transform2D)):
+            return Transform2D(self.m00 * other.m00 + self.m01 * other.m10,
+                               self.m00 * other.m01 + self.m01 * other.m11,
+                               self.m00 * other.m02 + self.m01 * other.m12 + self.m02,
+                               self.m10 * other.m00 + self.m11 * other.m10,
+                               self.m10 * other.m01 + self.m11 * other.m11,
+                               self.m10 * other.m02 + self.m11 * other.m12 + self.m12)
+        if (other.__class__ is Vector2):
+            return Vector2(self.m00 * other.x + self.m01 * other.y + self.m02, self.m10 * other.x + self.m11 * other.y + self.m12)
+        if (isinstance(other, (list, tuple))):
+            if (len(other) != 2):
+                raise ValueError("Point must have 2 coordinates!")
+            x, y = other
+            return (self.m00 * x + self.m01 * y + self.m02, self.m10 * x + self.m11 * y + self.m12)
+        return NotImplemented
+    
+    def copy(self):
+        """Return a copy of this transform."""
+        return Transform2D(self.m00, self.m01, self.m02, self.m10, self.m11, self.m12)
+    
+    def inverse(self):
+        """Inverse this transform. Raises ZeroDeterminantException if it cannot be inversed."""
+        det = self.m00 * self.m11 - self.m01 * self.m10
+        if (det == 0):
+            raise ZeroDeterminantException()
+        m00 = self.m11 / det
+        m01 = -self.m01 / det
+        m10 = -self.m10 / det
+        m11 = self.m00 / det
+        self.m02, self.m12 = -(m00 * self.m02 + m01 * self.m12), -(m10 * self.m02 + m11 * self.m12)
+        self.m00, self.m01, self.m10, self.m11 = m00, m01, m10, m11
+    
+    def inversed(self):
+        """Get inversed version of this transform."""
+        t = self.copy()
+        t.inverse()
+        return t
+    
+    def apply_points(self, points, out=None) -> array:
+        """Transform many points at once.
+        `points` - flat sequence of coordinates (x0, y0, x1, y1, ...);
+        [out] - float buffer (array or memoryview) of same length to write results to, can be `points` itself.
+        Returns `out` if it's given, otherwise new array of transformed coordinates."""
+        points = _point_buffer(points)
+        if (len(points) % 2 != 0):
+            raise ValueError("`points` must have 2 coordinates for every point!")
+        if (out is None):
+            out = array("d", [0.0]) * len(points)
+        elif (len(out) != len(points)):
+            raise ValueError("`out` must have same length as `points`!")
+        if (numpy is not None and len(points) >= NUMPY_MIN_POINTS * 2):
+            src = numpy.frombuffer(points).reshape(-1, 2)
+            dst = numpy.frombuffer(out).reshape(-1, 2)
+            linear = numpy.array([[self.m00, self.m01], [self.m10, self.m11]])
+            numpy.add(src @ linear.T, (self.m02, self.m12), out=dst)
+            return out
+        m00, m01, m02, m10, m11, m12 = self.m00, self.m01, self.m02, self.m10, self.m11, self.m12
+        xs = points[0::2]
+        ys = points[1::2]
+        out[0::2] = array("d", [m00 * x + m01 * y + m02 for x, y in zip(xs, ys)])
+        out[1::2] = array("d", [m10 * x + m11 * y + m12 for x, y in zip(xs, ys)])
+        return out
+    
+    def to_matrix(self) -> Matrix:
+        """Get 3x3 Matrix of this transform."""
+        mat = Matrix(3, 3)
+        mat._data[:] = array("d", (self.m00, self.m01, self.m02, self.m10, self.m11, self.m12, 0.0, 0.0, 1.0))
+        return mat
+
+class Transform3D():
+    """Affine transform of 3d space: 4x4 matrix with last row (0, 0, 0, 1).
+    `m00`..`m22` - linear part, `m03`, `m13`, `m23` - translation."""
+    __slots__ = ("m00", "m01", "m02", "m03", "m10", "m11", "m12", "m13", "m20", "m21", "m22", "m23")
+    
+    def __init__(self, m00: float=1.0, m01: float=0.0, m02: float=0.0, m03: float=0.0,
+                 m10: float=0.0, m11: float=1.0, m12: float=0.0, m13: float=0.0,
+                 m20: float=0.0, m21: float=0.0, m22: float=1.0, m23: float=0.0):
+        """Create a new Transform3D object from elements of first three rows of its matrix (identity by default)."""
+        self.m00, self.m01, self.m02, self.m03 = m00, m01, m02, m03
+        self.m10, self.m11, self.m12, self.m13 = m10, m11, m12, m13
+        self.m20, self.m21, self.m22, self.m23 = m20, m21, m22, m23
+    
+    @staticmethod
+    def translation(dx: float, dy: float, dz: float):
+        """Make translation transform (same as Matrix.make_translation)."""
+        return Transform3D(1.0, 0.0, 0.0, dx, 0.0, 1.0, 0.0, dy, 0.0, 0.0, 1.0, dz)
+    
+    @staticmethod
+    def rotation(angle_x: float, angle_y: float, angle_z: float):
+        """Make rotation transform around x, then y, then z axes, angles in degrees (same as Matrix.make_rotation)."""
+        r = Matrix._rotation(angle_x, angle_y, angle_z)
+        return Transform3D(r[0], r[1], r[2], 0.0, r[3], r[4], r[5], 0.0, r[6], r[7], r[8], 0.0)
+    
+    @staticmethod
+    def scale(x: float, y: float, z: float):
+        """Make scale transform (same as Matrix.make_scale)."""
+        return Transform3D(x, 0.0, 0.0, 0.0, 0.0, y, 0.0, 0.0, 0.0, 0.0, z, 0.0)
+    
+    @staticmethod
+    def from_matrix(mat: Matrix):
+        """Create a new Transform3D object from 4x4 Matrix (last row is ignored) or 3x3 Matrix (linear part only)."""
+        if (mat.rows == 4 and mat.columns == 4):
+            return Transform3D(*mat._data[:12])
+        if (mat.rows == 3 and mat.columns == 3):
+            d = mat._data
+            return Transform3D(d[0], d[1], d[2], 0.0, d[3], d[4], d[5], 0.0, d[6], d[7], d[8], 0.0)
+        raise WrongDimensionsException("Matrix must be 4x4 or 3x3 to make 3d transform!")
+    
+    def _elements(self) -> tuple:
+        """[INTERNAL] get elements of first three rows of matrix of this transform."""
+        return (self.m00, self.m01, self.m02, self.m03, self.m10, self.m11, self.m12, self.m13, self.m20, self.m21, self.m22, self.m23)
+    
+    def __eq__(self, other):
+        """Whether two transforms are equal."""
+        if (not isinstance(other, Transform3D)):
+            raise TypeError("Only transforms can be compared!")
+        return self._elements() == other._elements()
+    
+    def __str__(self):
+        """String representaion of this transform."""
+        return "Transform3D(%.2f %.2f %.2f %.2f, %.2f %.2f %.2f %.2f, %.2f %.2f %.2f %.2f)" % self._elements()
+    
+    def __mul__(self, other):
+        """Compose this transform with another (`other` is applied first, then this) or transform point (x, y, z) and return it.
+        Point given as Vector3 gives Vector3, otherwise tuple."""
+        if (isinstance(other, Transform3D)):
+            a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23 = self._elements()
+            b00, b01, b02, b03, b10, b11, b12, b13, b20, b21, b22, b23 = other._elements()
+            return Transform3D(a00 * b00 + a01 * b10 + a02 * b20, a00 * b01 + a01 * b11 + a02 * b21,
+                               a00 * b02 + a01 * b12 + a02 * b22, a00 * b03 + a01 * b13 + a02 * b23 + a03,
+                               a10 * b00 + a11 * b10 + a12 * b20, a10 * b01 + a11 * b11 + a12 * b21,
+                               a10 * b02 + a11 * b12 + a12 * b22, a10 * b03 + a11 * b13 + a12 * b23 + a13,
+                               a20 * b00 + a21 * b10 + a22 * b20, a20 * b01 + a21 * b11 + a22 * b21,
+                               a20 * b02 + a21 * b12 + a22 * b22, a20 * b03 + a21 * b13 + a22 * b23 + a23)
+        if (other.__class__ is Vector3):
+            x, y, z = other.x, other.y, other.z
+            return Vector3(self.m00 * x + self.m01 * y + self.m02 * z + self.m03,
+                           self.m10 * x + self.m11 * y + self.m12 * z + self.m13,
+                           self.m20 * x + self.m21 * y + self.m22 * z + self.m23)
+        if (isinstance(other, (list, tuple))):
+            if (len(other) != 3):
+                raise ValueError("Point must have 3 coordinates!")
+            x, y, z = other
+            return (self.m00 * x + self.m01 * y + self.m02 * z + self.m03,
+                    self.m10 * x + self.m11 * y + self.m12 * z + self.m13,
+                    self.m20 * x + self.m21 * y + self.m22 * z + self.m23)
+        return NotImplemented
+    
+    def copy(self):
+        """Return a copy of this transform."""
+        return Transform3D(*self._elements())
+    
+    def inverse(self):
+        """Inverse this transform. Raises ZeroDeterminantException if it cannot be inversed."""
+        a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23 = self._elements()
+        c00 = a11 * a22 - a12 * a21
+        c01 = a12 * a20 - a10 * a22
+        c02 = a10 * a21 - a11 * a20
+        det = a00 * c00 + a01 * c01 + a02 * c02
+        if (det == 0):
+            raise ZeroDeterminantException()
+        m00, m01, m02 = c00 / det, (a02 * a21 - a01 * a22) / det, (a01 * a12 - a02 * a11) / det
+        m10, m11, m12 = c01 / det, (a00 * a22 - a02 * a20) / det, (a02 * a10 - a00 * a12) / det
+        m20, m21, m22 = c02 / det, (a01 * a20 - a00 * a21) / det, (a00 * a11 - a01 * a10) / det
+        self.m00, self.m01, self.m02, self.m03 = m00, m01, m02, -(m00 * a03 + m01 * a13 + m02 * a23)
+        self.m10, self.m11, self.m12, self.m13 = m10, m11, m12, -(m10 * a03 + m11 * a13 + m12 * a23)
+        self.m20, self.m21, self.m22, self.m23 = m20, m21, m22, -(m20 * a03 + m21 * a13 + m22 * a23)
+    
+    def inversed(self):
+        """Get inversed version of this transform."""
+        t = self.copy()
+        t.inverse()
+        return t
+    
+    def apply_points(self, points, out=None) -> array:
+        """Transform many points at once.
+        `points` - flat sequence of coordinates (x0, y0, z0, x1, y1, z1, ...);
+        [out] - float buffer (array or memoryview) of same length to write results to, can be `points` itself.
+        Returns `out` if it's given, otherwise new array of transformed coordinates."""
+        points = _point_buffer(points)
+        if (len(points) % 3 != 0):
+            raise ValueError("`points` must have 3 coordinates for every point!")
+        if (out is None):
+            out = array("d", [0.0]) * len(points)
+        elif (len(out) != len(points)):
+            raise ValueError("`out` must have same length as `points`!")
+        if (numpy is not None and len(points) >= NUMPY_MIN_POINTS * 3):
+            src = numpy.frombuffer(points).reshape(-1, 3)
+            dst = numpy.frombuffer(out).reshape(-1, 3)
+            linear = numpy.array([[self.m00, self.m01, self.m02], [self.m10, self.m11, self.m12], [self.m20, self.m21, self.m22]])
+            numpy.add(src @ linear.T, (self.m03, self.m13, self.m23), out=dst)
+            return out
+        m00, m01, m02, m03, m10, m11, m12, m13, m20, m21, m22, m23 = self._elements()
+        xs = points[0::3]
+        ys = points[1::3]
+        zs = points[2::3]
+        out[0::3] = array("d", [m00 * x + m01 * y + m02 * z + m03 for x, y, z in zip(xs, ys, zs)])
+        out[1::3] = array("d", [m10 * x + m11 * y + m12 * z + m13 for x, y, z in zip(xs, ys, zs)])
+        out[2::3] = array("d", [m20 * x + m21 * y + m22 * z + m23 for x, y, z in zip(xs, ys, zs)])
+        return out
+    
+    def to_matrix(self) -> Matrix:
+        """Get 4x4 Matrix of this transform."""
+        mat = Matrix(4, 4)
+        mat._data[:] = array("d", self._elements() + (0.0, 0.0, 0.0, 1.0))
+        return mat
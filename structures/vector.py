@@ -1,8 +1,47 @@
-from math import acos
+from math import acos, sqrt
+from array import array
+from itertools import repeat
+from operator import add, sub, mul, truediv
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import elementwise
+
+# Batch operations over vector arrays with at least this count of vectors are performed with NumPy when it's available.
+NUMPY_MIN_VECTORS = 128
+# Count of vector differences computed at once while calculating pairwise distances with NumPy.
+PAIRWISE_BLOCK_ELEMENTS = 2 ** 20
 
 class Vector():
+    __slots__ = ("_values",)
+    
     def __init__(self, values=[]):
         self._values = list(values)
+    
+    @staticmethod
+    def from_numpy(arr):
+        """Create and return a new Vector from given one-dimensional NumPy array.
+        Raises ImportError if NumPy is not installed."""
+        if (numpy is None):
+            raise ImportError("NumPy is required to create vector from NumPy array!")
+        arr = numpy.asarray(arr)
+        if (arr.ndim != 1):
+            raise ValueError("NumPy array must be one-dimensional!")
+        return Vector(arr.tolist())
+    
+    def __array__(self, dtype=None, copy=None):
+        """Get NumPy array of this vector (NumPy array protocol)."""
+        arr = self.to_numpy(bool(copy))
+        if (dtype is not None):
+            arr = arr.astype(dtype, copy=False)
+        return arr
+    
+    def __buffer__(self, flags: int):
+        """Get memoryview of this vector (buffer protocol, Python 3.12+)."""
+        return self.buffer()
         
     def __len__(self):
         return len(self._values)
@@ -29,62 +68,70 @@ class Vector():
         return self._values[key]
     
     def __add__(self, other):
-        vec = Vector(self._values.copy())
-        if (isinstance(other, (int, float))):
-            for i in range(len(vec._values)):
-                vec._values[i] += other    
-        elif (isinstance(other, (list, tuple, Vector))):
-            if (len(other) != len(vec._values)):
-                raise ValueError("`other` must have same dimensions.")
-            for i in range(len(vec._values)):
-                vec._values[i] += other[i]
-        else:
-            raise TypeError("`other` - invalid type, must be: int, float, list, tuple, Vector")
-        return vec
+        return Vector(elementwise.combine(add, self._values, self._operand(other)))
     
     def __iadd__(self, other):
-        self._values = (self + other)._values
+        elementwise.combine(add, self._values, self._operand(other), self._values)
+        return self
         
     def __sub__(self, other):
-        vec = Vector(self._values.copy())
-        if (isinstance(other, (int, float))):
-            for i in range(len(vec._values)):
-                vec._values[i] -= other    
-        elif (isinstance(other, (list, tuple, Vector))):
-            if (len(other) != len(vec._values)):
-                raise ValueError("`other` must have same dimensions.")
-            for i in range(len(vec._values)):
-                vec._values[i] -= other[i]
-        else:
-            raise TypeError("`other` - invalid type, must be: int, float, list, tuple, Vector")
-        return vec    
+        return Vector(elementwise.combine(sub, self._values, self._operand(other)))
     
     def __isub__(self, other):
-        self._values = (self - other)._values    
+        elementwise.combine(sub, self._values, self._operand(other), self._values)
+        return self
     
     def __mul__(self, other):
-        vec = Vector(self._values.copy())
-        if (isinstance(other, (int, float))):
-            for i in range(len(vec._values)):
-                vec._values[i] *= other    
-        else:
+        if (not isinstance(other, (int, float))):
             raise TypeError("`other` - invalid type, must be: int, float. To multiply Vectors use dot, cross and triple product methods.")
-        return vec    
+        return Vector(elementwise.combine(mul, self._values, other))
     
     def __imul__(self, other):
-        self._values = (self * other)._values    
+        if (not isinstance(other, (int, float))):
+            raise TypeError("`other` - invalid type, must be: int, float. To multiply Vectors use dot, cross and triple product methods.")
+        elementwise.combine(mul, self._values, other, self._values)
+        return self
     
     def __div__(self, other):
-        vec = Vector(self._values.copy())
-        if (isinstance(other, (int, float))):
-            for i in range(len(vec._values)):
-                vec._values[i] /= other    
-        else:
+        if (not isinstance(other, (int, float))):
             raise TypeError("`other` - invalid type, must be: int, float.")
-        return vec        
+        return Vector(elementwise.combine(truediv, self._values, other))
     
     def __idiv__(self, other):
         self._values = (self / other)._values
+    
+    def _operand(self, other):
+        """[INTERNAL] check operand of element-wise operation and get it as number or sequence of values."""
+        if (isinstance(other, (int, float))):
+            return other
+        if (isinstance(other, (list, tuple, Vector))):
+            if (len(other) != len(self._values)):
+                raise ValueError("`other` must have same dimensions.")
+            return other._values if isinstance(other, Vector) else other
+        raise TypeError("`other` - invalid type, must be: int, float, list, tuple, Vector")
+    
+    def to_numpy(self, copy: bool=False):
+        """Get NumPy array of float values of this vector. Raises ImportError if NumPy is not installed.
+        [copy] - False - array shares storage with this vector if it's possible (matrix rows), True - array is always independent copy."""
+        if (numpy is None):
+            raise ImportError("NumPy is required to convert vector to NumPy array!")
+        arr = numpy.asarray(self.buffer())
+        return arr.copy() if copy and isinstance(self._values, memoryview) else arr
+    
+    def buffer(self) -> memoryview:
+        """Get memoryview of float values of this vector.
+        Vector stores values in list, so memoryview is made over their copy. Memoryview of matrix row shares storage with the matrix."""
+        if (isinstance(self._values, memoryview)):
+            return self._values
+        return memoryview(array("d", self._values))
+    
+    def apply(self, func):
+        """Get a new vector with `func` applied to every element of this vector."""
+        return Vector(elementwise.apply(func, self._values))
+    
+    def map2(self, func, other):
+        """Get a new vector of `func` results for every pair of elements of this vector and `other` (sequence of same length or number)."""
+        return Vector(elementwise.combine(func, self._values, self._operand(other)))
         
     def clear(self):
         """Clear this vector."""
@@ -92,7 +139,7 @@ class Vector():
         
     def copy(self):
         """Copy this vector."""
-        return Vector(self._values.copy())
+        return Vector(self._values)
         
     def append(self, value):
         """Add `value` at vector's end."""
@@ -172,3 +219,503 @@ class Vector():
     def angle_between(self, other) -> float:
         """Get angle between 2 vectors in radians."""
         return acos(self.dot_product(other) / (self.length() * other.length()))    
+
+class FixedVector(Vector):
+    """Base of fixed-dimension vectors (Vector2, Vector3, Vector4) storing elements in slots instead of list.
+    Fixed vectors are immutable: every operation gives a new vector, so they can be compared, hashed and used as dict keys.
+    Operands can be fixed vectors (fast path), Vectors or sequences of same dimension, element-wise operators also take numbers."""
+    __slots__ = ()
+    
+    @property
+    def _values(self):
+        """[INTERNAL] elements of this vector as list (used by inherited Vector methods)."""
+        return list(self)
+    
+    def __len__(self):
+        return len(self.__slots__)
+    
+    def __getitem__(self, key):
+        if (isinstance(key, slice)):
+            return Vector(tuple(self)[key])
+        return tuple(self)[key]
+    
+    def __setitem__(self, key, value):
+        raise TypeError("Fixed vector is immutable!")
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Fixed vector is immutable!")
+    
+    def __delattr__(self, name):
+        raise AttributeError("Fixed vector is immutable!")
+    
+    def __str__(self):
+        return "{0}({1})".format(self.__class__.__name__, ", ".join(map(str, self)))
+    
+    __repr__ = __str__
+    
+    def __hash__(self):
+        return hash(tuple(self))
+    
+    def __radd__(self, other):
+        return self + other
+    
+    def __rsub__(self, other):
+        return -self + other
+    
+    def __rmul__(self, other):
+        return self * other
+    
+    def __iadd__(self, other):
+        return self + other
+    
+    def __isub__(self, other):
+        return self - other
+    
+    def __imul__(self, other):
+        return self * other
+    
+    def __div__(self, other):
+        if (not isinstance(other, (int, float))):
+            raise TypeError("`other` - invalid type, must be: int, float.")
+        return self * (1 / other)
+    
+    __truediv__ = __idiv__ = __itruediv__ = __div__
+    
+    def _operand(self, other):
+        """[INTERNAL] check operand of element-wise operation and get it as vector of this type."""
+        if (isinstance(other, (int, float))):
+            return self.__class__(*([other] * len(self)))
+        if (isinstance(other, (list, tuple, Vector))):
+            if (len(other) != len(self)):
+                raise ValueError("`other` must have same dimensions.")
+            return self.__class__(*other)
+        raise TypeError("`other` - invalid type, must be: int, float, list, tuple, Vector")
+    
+    def _vector(self, other):
+        """[INTERNAL] check operand of vector product and get it as vector of this type."""
+        if (not isinstance(other, Vector)):
+            raise TypeError("`other` must be a Vector object.")
+        if (len(other) != len(self)):
+            raise ValueError("`other` must have same dimensions.")
+        return self.__class__(*other)
+    
+    def _fixed_length(self, *args, **kwargs):
+        """[INTERNAL] raise TypeError for methods which change the vector."""
+        raise TypeError("Fixed vector is immutable!")
+    
+    clear = append = insert = extend = pop = _fixed_length
+    
+    def copy(self):
+        """Copy this vector."""
+        return self.__class__(*self)
+    
+    def to_vector(self):
+        """Get elements of this vector as a new (variable-length) Vector."""
+        return Vector(self)
+
+class Vector2(FixedVector):
+    """Two-dimension vector (x, y), see FixedVector."""
+    __slots__ = ("x", "y")
+    
+    def __init__(self, x: float=0.0, y: float=0.0):
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+    
+    def __iter__(self):
+        return iter((self.x, self.y))
+    
+    def __eq__(self, other):
+        if (other.__class__ is not Vector2):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+    
+    def __hash__(self):
+        return hash((self.x, self.y))
+    
+    def __add__(self, other):
+        if (other.__class__ is not Vector2):
+            other = self._operand(other)
+        return Vector2(self.x + other.x, self.y + other.y)
+    
+    def __sub__(self, other):
+        if (other.__class__ is not Vector2):
+            other = self._operand(other)
+        return Vector2(self.x - other.x, self.y - other.y)
+    
+    def __mul__(self, other):
+        if (not isinstance(other, (int, float))):
+            raise TypeError("`other` - invalid type, must be: int, float. To multiply Vectors use dot, cross and triple product methods.")
+        return Vector2(self.x * other, self.y * other)
+    
+    def __neg__(self):
+        return Vector2(-self.x, -self.y)
+    
+    def length(self) -> float:
+        """Get vector length."""
+        return sqrt(self.x * self.x + self.y * self.y)
+    
+    def euclidean_distance(self, other) -> float:
+        """Get Euclidean distance between this and other vector. Vectors must have same dimensions."""
+        if (other.__class__ is not Vector2):
+            other = self._vector(other)
+        dx = other.x - self.x
+        dy = other.y - self.y
+        return sqrt(dx * dx + dy * dy)
+    
+    def dot_product(self, other) -> float:
+        """Get a dot product between two vectors."""
+        if (other.__class__ is not Vector2):
+            other = self._vector(other)
+        return self.x * other.x + self.y * other.y
+
+class Vector3(FixedVector):
+    """Three-dimension vector (x, y, z), see FixedVector."""
+    __slots__ = ("x", "y", "z")
+    
+    def __init__(self, x: float=0.0, y: float=0.0, z: float=0.0):
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "z", z)
+    
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+    
+    def __eq__(self, other):
+        if (other.__class__ is not Vector3):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y and self.z == other.z
+    
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
+    
+    def __add__(self, other):
+        if (other.__class__ is not Vector3):
+            other = self._operand(other)
+        return Vector3(self.x + other.x, self.y + other.y, self.z + other.z)
+    
+    def __sub__(self, other):
+        if (other.__class__ is not Vector3):
+            other = self._operand(other)
+        return Vector3(self.x - other.x, self.y - other.y, self.z - other.z)
+    
+    def __mul__(self, other):
+        if (not isinstance(other, (int, float))):
+            raise TypeError("`other` - invalid type, must be: int, float. To multiply Vectors use dot, cross and triple product methods.")
+        return Vector3(self.x * other, self.y * other, self.z * other)
+    
+    def __neg__(self):
+        return Vector3(-self.x, -self.y, -self.z)
+    
+    def length(self) -> float:
+        """Get vector length."""
+        return sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+    
+    def euclidean_distance(self, other) -> float:
+        """Get Euclidean distance between this and other vector. Vectors must have same dimensions."""
+        if (other.__class__ is not Vector3):
+            other = self._vector(other)
+        dx = other.x - self.x
+        dy = other.y - self.y
+        dz = other.z - self.z
+        return sqrt(dx * dx + dy * dy + dz * dz)
+    
+    def dot_product(self, other) -> float:
+        """Get a dot product between two vectors."""
+        if (other.__class__ is not Vector3):
+            other = self._vector(other)
+        return self.x * other.x + self.y * other.y + self.z * other.z
+    
+    def cross_product(self, other):
+        """Get a cross product between two three-dimension vectors."""
+        if (other.__class__ is not Vector3):
+            other = self._vector(other)
+        return Vector3(self.y * other.z - self.z * other.y, self.z * other.x - self.x * other.z, self.x * other.y - self.y * other.x)
+    
+    def triple_product(self, v2, v3) -> float:
+        """Get a triple product between three three-dimension vectors."""
+        return self.dot_product(Vector3.cross_product(v2 if v2.__class__ is Vector3 else self._vector(v2), v3))
+
+class Vector4(FixedVector):
+    """Four-dimension vector (x, y, z, w), see FixedVector."""
+    __slots__ = ("x", "y", "z", "w")
+    
+    def __init__(self, x: float=0.0, y: float=0.0, z: float=0.0, w: float=0.0):
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "z", z)
+        object.__setattr__(self, "w", w)
+    
+    def __iter__(self):
+        return iter((self.x, self.y, self.z, self.w))
+    
+    def __eq__(self, other):
+        if (other.__class__ is not Vector4):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y and self.z == other.z and self.w == other.w
+    
+    def __hash__(self):
+        return hash((self.x, self.y, self.z, self.w))
+    
+    def __add__(self, other):
+        if (other.__class__ is not Vector4):
+            other = self._operand(other)
+        return Vector4(self.x + other.x, self.y + other.y, self.z + other.z, self.w + other.w)
+    
+    def __sub__(self, other):
+        if (other.__class__ is not Vector4):
+            other = self._operand(other)
+        return Vector4(self.x - other.x, self.y - other.y, self.z - other.z, self.w - other.w)
+    
+    def __mul__(self, other):
+        if (not isinstance(other, (int, float))):
+            raise TypeError("`other` - invalid type, must be: int, float. To multiply Vectors use dot, cross and triple product methods.")
+        return Vector4(self.x * other, self.y * other, self.z * other, self.w * other)
+    
+    def __neg__(self):
+        return Vector4(-self.x, -self.y, -self.z, -self.w)
+    
+    def length(self) -> float:
+        """Get vector length."""
+        return sqrt(self.x * self.x + self.y * self.y + self.z * self.z + self.w * self.w)
+    
+    def euclidean_distance(self, other) -> float:
+        """Get Euclidean distance between this and other vector. Vectors must have same dimensions."""
+        if (other.__class__ is not Vector4):
+            other = self._vector(other)
+        dx = other.x - self.x
+        dy = other.y - self.y
+        dz = other.z - self.z
+        dw = other.w - self.w
+        return sqrt(dx * dx + dy * dy + dz * dz + dw * dw)
+    
+    def dot_product(self, other) -> float:
+        """Get a dot product between two vectors."""
+        if (other.__class__ is not Vector4):
+            other = self._vector(other)
+        return self.x * other.x + self.y * other.y + self.z * other.z + self.w * other.w
+
+class VectorArray():
+    """Array of vectors of same dimension stored contiguously: coordinates of all vectors in one flat float array (vector after vector).
+    Batch operations (norms, dot products, distances, normalization, cross products) are performed by one call over all vectors,
+    with NumPy when it's available and array has at least NUMPY_MIN_VECTORS vectors, otherwise with pure Python over coordinate arrays."""
+    def __init__(self, vectors=[], dimension: int=None):
+        """Create a new VectorArray object.
+        [vectors] - iterable of vectors (Vector, fixed vectors or sequences of numbers) of same dimension;
+        [dimension] - dimension of vectors, required if `vectors` is empty."""
+        vectors = list(vectors)
+        if (dimension is None):
+            if (not vectors):
+                raise ValueError("`dimension` must be given for empty vector array.")
+            dimension = len(vectors[0])
+        if (dimension < 1):
+            raise ValueError("Vectors must have positive dimension!")
+        self._dimension = dimension
+        self._data = array("d")
+        self.extend(vectors)
+    
+    @staticmethod
+    def _from_array(data: array, dimension: int):
+        """[INTERNAL] create a new VectorArray over given flat array of coordinates (array is not copied)."""
+        out = VectorArray(dimension=dimension)
+        out._data = data
+        return out
+    
+    @staticmethod
+    def from_numpy(arr):
+        """Create and return a new VectorArray from given two-dimensional NumPy array (one vector per row).
+        Raises ImportError if NumPy is not installed."""
+        if (numpy is None):
+            raise ImportError("NumPy is required to create vector array from NumPy array!")
+        arr = numpy.asarray(arr, dtype=float)
+        if (arr.ndim != 2):
+            raise ValueError("NumPy array must be two-dimensional!")
+        return VectorArray._from_array(array("d", arr.tobytes()), arr.shape[1])
+    
+    @property
+    def dimension(self) -> int:
+        """Get dimension of vectors in this array."""
+        return self._dimension
+    
+    def __len__(self):
+        return len(self._data) // self._dimension
+    
+    def __getitem__(self, key):
+        """Get copy of vector at `key` pos. Slice gives a new VectorArray."""
+        d = self._dimension
+        if (isinstance(key, slice)):
+            return VectorArray._from_array(self._slice(key), d)
+        start = range(len(self))[key] * d
+        return Vector(self._data[start:start + d])
+    
+    def __setitem__(self, key, value):
+        """Set vector at `key` pos."""
+        if (len(value) != self._dimension):
+            raise ValueError("`value` must have same dimension as vectors of array.")
+        start = range(len(self))[key] * self._dimension
+        self._data[start:start + self._dimension] = array("d", value)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    def __str__(self):
+        return "VectorArray(" + ", ".join(str(tuple(v)) for v in self) + ")"
+    
+    def _slice(self, key: slice) -> array:
+        """[INTERNAL] get coordinates of vectors selected by slice."""
+        d = self._dimension
+        start, stop, step = key.indices(len(self))
+        if (step == 1):
+            return self._data[start * d:max(stop, start) * d]
+        out = array("d")
+        for i in range(start, stop, step):
+            out += self._data[i * d:(i + 1) * d]
+        return out
+    
+    def _numpy(self) -> bool:
+        """[INTERNAL] whether batch operations over this array are performed with NumPy."""
+        return numpy is not None and len(self) >= NUMPY_MIN_VECTORS
+    
+    def _components(self) -> list:
+        """[INTERNAL] get arrays of coordinates of all vectors: i-th array holds i-th coordinates."""
+        return [self._data[k::self._dimension] for k in range(self._dimension)]
+    
+    def _other(self, other):
+        """[INTERNAL] check operand of batch operation: VectorArray of same dimension and length, or vector of same dimension (returned as list)."""
+        if (isinstance(other, VectorArray)):
+            if (other._dimension != self._dimension or len(other) != len(self)):
+                raise ValueError("`other` must have same dimension and length.")
+            return other
+        if (len(other) != self._dimension):
+            raise ValueError("`other` must have same dimension.")
+        return list(other)
+    
+    def append(self, vector):
+        """Add `vector` at array's end."""
+        if (len(vector) != self._dimension):
+            raise ValueError("`vector` must have same dimension as vectors of array.")
+        self._data.extend(vector)
+    
+    def extend(self, vectors):
+        """Add vectors from iterable at array's end."""
+        for v in vectors:
+            self.append(v)
+    
+    def clear(self):
+        """Remove all vectors from this array."""
+        self._data = array("d")
+    
+    def copy(self):
+        """Copy this array."""
+        return VectorArray._from_array(self._data[:], self._dimension)
+    
+    def to_numpy(self, copy: bool=False):
+        """Get two-dimensional NumPy array of this array (one vector per row). Raises ImportError if NumPy is not installed.
+        [copy] - False - NumPy array shares storage with this array (until vectors are added or removed), True - NumPy array is independent copy."""
+        if (numpy is None):
+            raise ImportError("NumPy is required to convert vector array to NumPy array!")
+        arr = numpy.frombuffer(self._data).reshape(len(self), self._dimension)
+        return arr.copy() if copy else arr
+    
+    def buffer(self) -> memoryview:
+        """Get memoryview of flat coordinates of this array."""
+        return memoryview(self._data)
+    
+    def norms(self) -> Vector:
+        """Get lengths of all vectors."""
+        if (self._numpy()):
+            return Vector(numpy.linalg.norm(self.to_numpy(), axis=1).tolist())
+        return Vector(map(sqrt, self._squares(self._components())))
+    
+    @staticmethod
+    def _squares(components: list) -> list:
+        """[INTERNAL] get sums of squares of coordinates for every vector from its coordinate arrays."""
+        sums = list(map(mul, components[0], components[0]))
+        for c in components[1:]:
+            sums = list(map(add, sums, map(mul, c, c)))
+        return sums
+    
+    def dot(self, other) -> Vector:
+        """Get dot products of every vector with `other` vector, or with vector at same pos of `other` VectorArray."""
+        other = self._other(other)
+        if (self._numpy()):
+            if (isinstance(other, VectorArray)):
+                return Vector(numpy.einsum("ij,ij->i", self.to_numpy(), other.to_numpy()).tolist())
+            return Vector((self.to_numpy() @ numpy.array(other, dtype=float)).tolist())
+        if (isinstance(other, VectorArray)):
+            pairs = zip(self._components(), other._components())
+        else:
+            pairs = zip(self._components(), map(repeat, other))
+        sums = [0.0] * len(self)
+        for c, o in pairs:
+            sums = list(map(add, sums, map(mul, c, o)))
+        return Vector(sums)
+    
+    def distances_to(self, point) -> Vector:
+        """Get Euclidean distances of every vector to `point` (vector of same dimension)."""
+        if (isinstance(point, VectorArray)):
+            raise TypeError("`point` must be a vector.")
+        point = self._other(point)
+        if (self._numpy()):
+            diff = self.to_numpy() - numpy.array(point, dtype=float)
+            return Vector(numpy.sqrt(numpy.einsum("ij,ij->i", diff, diff)).tolist())
+        return Vector(map(sqrt, self._squares([array("d", map(sub, c, repeat(p))) for c, p in zip(self._components(), point)])))
+    
+    def pairwise_distances(self, other=None):
+        """Get Matrix of Euclidean distances between vectors: element (i, j) is distance between i-th vector of this array and j-th vector of `other`.
+        [other] - VectorArray of same dimension, this array by default."""
+        from matrix import Matrix
+        if (other is None):
+            other = self
+        if (not isinstance(other, VectorArray) or other._dimension != self._dimension):
+            raise ValueError("`other` must be a VectorArray of same dimension.")
+        out = Matrix(len(self), len(other))
+        if (self._numpy() or other._numpy()):
+            a = self.to_numpy()
+            b = other.to_numpy()
+            dist = out.to_numpy()
+            block = max(1, PAIRWISE_BLOCK_ELEMENTS // max(1, len(other) * self._dimension))
+            for i in range(0, len(self), block):
+                diff = a[i:i + block, None, :] - b[None, :, :]
+                numpy.sqrt(numpy.einsum("ijk,ijk->ij", diff, diff), out=dist[i:i + block])
+        else:
+            for i in range(len(self)):
+                out[i] = other.distances_to(self[i])
+        return out
+    
+    def normalize(self):
+        """Normalize all vectors of this array in place (divide by length). Zero vectors are left as they are."""
+        if (self._numpy()):
+            arr = self.to_numpy()
+            norms = numpy.linalg.norm(arr, axis=1)
+            numpy.divide(arr, norms[:, None], out=arr, where=norms[:, None] != 0.0)
+        else:
+            norms = [n or 1.0 for n in self.norms()]
+            d = self._dimension
+            for k in range(d):
+                self._data[k::d] = array("d", map(truediv, self._data[k::d], norms))
+    
+    def normalized(self):
+        """Get a new array of normalized vectors of this array (see `normalize`)."""
+        out = self.copy()
+        out.normalize()
+        return out
+    
+    def cross(self, other):
+        """Get VectorArray of cross products of every three-dimension vector with `other` vector, or with vector at same pos of `other` VectorArray."""
+        if (self._dimension != 3):
+            raise ValueError("Cross product can only be calculated for three-dimension vectors.")
+        other = self._other(other)
+        if (self._numpy()):
+            b = other.to_numpy() if isinstance(other, VectorArray) else numpy.array(other, dtype=float)
+            return VectorArray.from_numpy(numpy.cross(self.to_numpy(), b))
+        x, y, z = self._components()
+        if (isinstance(other, VectorArray)):
+            ox, oy, oz = other._components()
+        else:
+            ox, oy, oz = ([o] * len(self) for o in other)
+        out = array("d", [0.0]) * len(self._data)
+        out[0::3] = array("d", map(sub, map(mul, y, oz), map(mul, z, oy)))
+        out[1::3] = array("d", map(sub, map(mul, z, ox), map(mul, x, oz)))
+        out[2::3] = array("d", map(sub, map(mul, x, oy), map(mul, y, ox)))
+        return VectorArray._from_array(out, 3)
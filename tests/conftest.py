@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules of `structures` import each other by flat names.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "structures"))
@@ -0,0 +1,112 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from math import inf
+
+import pytest
+
+import graph
+from graph import Graph
+from matrix import Matrix
+
+def test_from_edges_duplicate_undirected_edges_keep_last_weight():
+    edges = [("a", "b", 1.0), ("b", "a", 2.0)]
+    for sparse in (False, True):
+        g = Graph.from_edges(edges, weighted=True, sparse=sparse)
+        ref = Graph(sparse)
+        ref.weighted = True
+        ref.add_vertices(["a", "b"])
+        for edge in edges:
+            ref.connect(*edge)
+        assert g.weight("a", "b") == g.weight("b", "a") == 2.0
+        assert ref.weight("a", "b") == ref.weight("b", "a") == 2.0
+
+def _brute_force(n, edges, oriented):
+    """Get shortest distances by weight and by edge count between all pairs by enumerating all simple paths."""
+    weights = {}
+    for i, j, w in edges:
+        weights[i, j] = w
+        if (not oriented):
+            weights[j, i] = w
+    distances = {}
+    hops = {}
+    def walk(source, vertex, visited, length):
+        key = (source, vertex)
+        distances[key] = min(distances.get(key, inf), length)
+        hops[key] = min(hops.get(key, inf), len(visited) - 1)
+        for (i, j), w in weights.items():
+            if (i == vertex and j not in visited):
+                walk(source, j, visited + [j], length + w)
+    for source in range(n):
+        walk(source, source, [source], 0.0)
+    return weights, distances, hops
+
+def _random_graphs():
+    rnd = random.Random(7)
+    for trial in range(40):
+        n = rnd.randint(1, 6)
+        edges = [(rnd.randrange(n), rnd.randrange(n), rnd.choice([0.5, 1.0, 2.0, 3.5])) for k in range(rnd.randint(0, 2 * n))]
+        edges = [e for e in edges if e[0] != e[1]]
+        oriented = rnd.random() < 0.5
+        for sparse in (False, True):
+            yield n, Graph.from_edges(edges, range(n), oriented=oriented, weighted=True, sparse=sparse), _brute_force(n, edges, oriented)
+
+def _check_path(weights, path, source, target, distance):
+    assert path[0] == source and path[-1] == target
+    assert abs(sum(weights[path[k], path[k + 1]] for k in range(len(path) - 1)) - distance) < 1e-9
+
+def test_searches_match_brute_force():
+    for n, g, (weights, distances, hops) in _random_graphs():
+        for source in range(n):
+            found = g.dijkstra(source)
+            by_edges = g.bfs(source)
+            for target in range(n):
+                expected = distances.get((source, target), inf)
+                assert found.distance(target) == expected
+                assert g.dijkstra(source, target).distance(target) == expected
+                star = g.astar(source, target, lambda vertex, goal: 0.0)
+                assert star.distance(target) == expected
+                assert by_edges.distance(target) == hops.get((source, target), inf)
+                if (expected == inf):
+                    assert found.path(target) == [] and not found.reachable(target)
+                else:
+                    _check_path(weights, found.path(target), source, target, expected)
+                    _check_path(weights, star.path(target), source, target, expected)
+                    assert len(by_edges.path(target)) - 1 == hops[source, target]
+
+def test_all_pairs_match_brute_force():
+    for n, g, (weights, distances, hops) in _random_graphs():
+        paths = g.all_pairs()
+        assert g.all_pairs() is paths
+        for source in range(n):
+            for target in range(n):
+                expected = distances.get((source, target), inf)
+                assert paths.distance(source, target) == g.distance(source, target) == expected
+                if (expected == inf):
+                    assert paths.path(source, target) == [] and paths.next_hop(source, target) is None
+                else:
+                    path = paths.path(source, target)
+                    _check_path(weights, path, source, target, expected)
+                    assert paths.next_hop(source, target) == (path[1] if len(path) > 1 else None)
+        if (n > 1):
+            g.connect(0, n - 1, 0.25)
+            assert g.all_pairs() is not paths and g.distance(0, n - 1) == 0.25
+
+def test_all_pairs_in_process_pool(monkeypatch):
+    monkeypatch.setattr(graph, "PARALLEL_MIN_VERTICES", 4)
+    edges = [(i, (i * 7 + k) % 40, 1.0 + k) for i in range(40) for k in range(1, 4) if (i * 7 + k) % 40 != i]
+    g = Graph.from_edges(edges, oriented=True, weighted=True, sparse=True)
+    expected = [[g.dijkstra(i).distance(j) for j in range(40)] for i in range(40)]
+    with ProcessPoolExecutor(2) as executor:
+        Matrix.set_executor(executor, 2)
+        try:
+            paths = g.all_pairs()
+        finally:
+            Matrix.set_executor(None)
+    assert [[paths.distance(i, j) for j in range(40)] for i in range(40)] == expected
+
+def test_astar_requires_target():
+    g = Graph.from_edges([(0, 1)])
+    with pytest.raises(ValueError):
+        g.astar(0, None, lambda vertex, goal: 0.0)
+    with pytest.raises(ValueError):
+        g.dijkstra(0, 5)
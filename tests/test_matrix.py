@@ -0,0 +1,185 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+import pytest
+
+import matrix
+from matrix import Matrix, WrongDimensionsException, ZeroDeterminantException
+from sparsematrix import SparseMatrix
+from vector import Vector
+
+def test_scalar_operands_fraction():
+    m = Matrix.identity(2)
+    assert m * Fraction(1, 2) == Matrix.identity(2) * 0.5
+    assert Fraction(1, 2) * m == Matrix.identity(2) * 0.5
+    assert list((m + Fraction(1, 4))._data) == [1.25, 0.25, 0.25, 1.25]
+    s = SparseMatrix.from_matrix(m)
+    assert (s * Fraction(1, 2)).to_matrix() == m * 0.5
+
+def test_scalar_operands_numpy():
+    numpy = pytest.importorskip("numpy")
+    m = Matrix.identity(2)
+    product = m * numpy.int64(2)
+    assert isinstance(product, Matrix) and product == m * 2
+    total = m + numpy.float32(1)
+    assert isinstance(total, Matrix) and list(total._data) == [2.0, 1.0, 1.0, 2.0]
+    m *= numpy.int64(3)
+    assert m == Matrix.identity(2) * 3
+    s = SparseMatrix.from_matrix(Matrix.identity(2)) * numpy.int64(2)
+    assert isinstance(s, SparseMatrix) and s.to_matrix() == Matrix.identity(2) * 2
+
+def test_non_number_operand_raises():
+    with pytest.raises(TypeError):
+        Matrix.identity(2) * "x"
+
+def test_row_slice_assignment():
+    m = Matrix.identity(3)
+    determinant = m.get_determinant()
+    m[0][0:2] = [2, 3]
+    m[1][1:] = (4, 5)
+    m[2][::2] = Vector([6, 7])
+    assert list(m._data) == [2.0, 3.0, 0.0, 0.0, 4.0, 5.0, 6.0, 0.0, 7.0]
+    assert m.get_determinant() != determinant
+    with pytest.raises(ValueError):
+        m[0][0:2] = [1, 2, 3]
+
+def _matrix(rows):
+    m = Matrix(len(rows), len(rows[0]))
+    for i, row in enumerate(rows):
+        m[i] = row
+    return m
+
+def _close(a, b, eps=1e-9):
+    return len(a) == len(b) and all(abs(x - y) <= eps for x, y in zip(a, b))
+
+A = [[4.0, -2.0, 1.0], [3.0, 6.0, -4.0], [2.0, 1.0, 8.0]]
+X = [1.0, -2.0, 3.0]
+B = [sum(a * x for a, x in zip(row, X)) for row in A]
+
+def test_lu_reconstructs_permuted_matrix():
+    m = _matrix(A)
+    lu = m.lu()
+    product = lu.lower() * lu.upper()
+    permuted = _matrix([A[p] for p in lu.pivots])
+    assert _close(list(product._data), list(permuted._data))
+    # Cofactor expansion by first row: 4 * 52 + 2 * 32 + 1 * (-9).
+    assert abs(lu.determinant() - 263.0) < 1e-9
+    assert abs(m.get_determinant() - 263.0) < 1e-9
+
+def test_solve_known_solution():
+    m = _matrix(A)
+    assert _close(list(m.solve(B)), X)
+    assert _close(list(m.solve(Vector(B))), X)
+    results = m.solve([B, [2 * e for e in B]], cache=False)
+    assert _close(list(results[0]), X) and _close(list(results[1]), [2 * e for e in X])
+    rhs = Matrix(3, 2)
+    for i in range(3):
+        rhs[i] = [B[i], -B[i]]
+    solved = m.solve(rhs)
+    assert solved.rows == 3 and solved.columns == 2
+    assert _close([solved[i, 0] for i in range(3)], X) and _close([solved[i, 1] for i in range(3)], [-e for e in X])
+
+def test_solve_wrong_right_hand_side():
+    with pytest.raises(ValueError):
+        _matrix(A).solve([1.0, 2.0])
+    with pytest.raises(TypeError):
+        _matrix(A).solve("abc")
+
+def test_singular_matrix_errors():
+    m = _matrix([[1.0, 2.0], [2.0, 4.0]])
+    assert m.get_determinant() == 0.0
+    assert m.lu().singular
+    with pytest.raises(ZeroDeterminantException):
+        m.solve([1.0, 2.0])
+    with pytest.raises(ZeroDeterminantException):
+        m.inversed()
+    with pytest.raises(WrongDimensionsException):
+        Matrix(2, 3).lu()
+
+def test_inverse_in_place_and_cached():
+    m = _matrix(A)
+    inversed = m.inversed()
+    assert _close(list((m * inversed)._data), list(Matrix.identity(3)._data))
+    inversed[0, 0] = 100.0
+    assert m.inversed() != inversed
+    again = m.copy()
+    again.inverse()
+    assert _close(list(again._data), list(m.inversed()._data))
+    m[0, 0] = 5.0
+    assert _close(list((m * m.inversed())._data), list(Matrix.identity(3)._data))
+
+def test_views_copy_on_write():
+    m = _matrix(A)
+    t = m.transposed_view()
+    assert t == m.transposed()
+    minor = m.minor_view(0, 1)
+    assert minor == _matrix([[3.0, -4.0], [2.0, 8.0]])
+    assert minor.get_determinant() == Matrix.minor(m, 0, 1).get_determinant()
+    m[1, 0] = 7.0
+    assert t[0, 1] == 7.0 and minor[0, 0] == 7.0
+    t[0, 1] = -1.0
+    assert m[1, 0] == 7.0 and t[0, 1] == -1.0
+    m[1, 0] = 9.0
+    assert t[0, 1] == -1.0
+    sub = m[0:2, 1:]
+    assert sub == _matrix([[-2.0, 1.0], [6.0, -4.0]])
+
+def test_csv_round_trip(tmp_path):
+    m = _matrix(A)
+    m[0, 0] = 0.1
+    path = str(tmp_path / "m.csv")
+    m.to_csv(path)
+    assert Matrix.from_csv(path) == m
+    assert Matrix.from_csv(path, chunk_size=5) == m
+    assert [list(row) for row in Matrix.iter_rows_csv(path, chunk_size=3)] == [list(m[i]) for i in range(3)]
+    out = Matrix(3, 3)
+    assert Matrix.from_csv(path, out=out) is out and out == m
+    m.to_csv(path, delimiter=None)
+    assert Matrix.from_csv(path, delimiter=None) == m
+    with open(path, "a") as f:
+        f.write("1 2\n")
+    with pytest.raises(ValueError):
+        Matrix.from_csv(path, delimiter=None)
+
+def test_binary_round_trip_and_truncated_file(tmp_path):
+    m = _matrix(A)
+    path = str(tmp_path / "m.bin")
+    for dtype in ("d", "f"):
+        m.write(path, dtype)
+        for mapped in (False, True):
+            read = Matrix(0, 0)
+            read.read(path, mapped)
+            assert read == m
+    m.write(path)
+    view = Matrix.map_file(path)
+    assert view.shape == (3, 3) and view.tolist() == A
+    view.release()
+    with open(path, "rb") as f:
+        data = f.read()
+    for size in (len(data) - 8, 10):
+        with open(path, "wb") as f:
+            f.write(data[:size])
+        for mapped in (False, True):
+            with pytest.raises(ValueError):
+                Matrix(0, 0).read(path, mapped)
+        with pytest.raises(ValueError):
+            Matrix.map_file(path)
+
+def test_elimination_in_process_pool(monkeypatch):
+    monkeypatch.setattr(matrix, "PARALLEL_MIN_ROWS", 8)
+    rnd = random.Random(5)
+    m = _matrix([[rnd.uniform(-1.0, 1.0) for j in range(70)] for i in range(70)])
+    lu = m.lu()
+    triangle = m.copy()
+    triangle.to_lower_triangle()
+    with ProcessPoolExecutor(2) as executor:
+        Matrix.set_executor(executor, 2)
+        try:
+            parallel_lu = matrix.LUDecomposition(m)
+            parallel_triangle = m.copy()
+            parallel_triangle.to_lower_triangle()
+        finally:
+            Matrix.set_executor(None)
+    assert parallel_lu.lu == lu.lu and parallel_lu.pivots == lu.pivots and parallel_lu.sign == lu.sign
+    assert parallel_triangle == triangle
@@ -0,0 +1,10 @@
+from petri import PetriNet
+
+def test_sparse_incidence_matches_dense_with_repeated_arcs():
+    net = PetriNet(3, 2, [["p0"], ["p1", "p2"]], [["p1"], ["p0"]])
+    net.connect("p0", "t0", 1)
+    net.connect("p1", "t1", 2)
+    net.connect("p1", "t0", 3, True)
+    assert net.incidence(sparse=True).to_matrix() == net.incidence()
+    net.set_marking([1, 1, 1])
+    assert list(net.marking(["t0"])) == [0, 2, 1]
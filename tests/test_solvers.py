@@ -0,0 +1,54 @@
+import pytest
+
+from matrix import Matrix
+from sparsematrix import SparseMatrix
+from solvers import conjugate_gradient, jacobi, gauss_seidel
+
+def _poisson(n):
+    m = Matrix(n, n)
+    for i in range(n):
+        m[i, i] = 4.0
+        if (i > 0):
+            m[i, i - 1] = -1.0
+        if (i < n - 1):
+            m[i, i + 1] = -1.0
+    return m
+
+def test_solvers_converge_to_direct_solution():
+    a = _poisson(12)
+    b = [float(i % 5) - 2.0 for i in range(12)]
+    expected = list(a.solve(b))
+    for solver in (conjugate_gradient, jacobi, gauss_seidel):
+        for coefficients in (a, SparseMatrix.from_matrix(a)):
+            result = solver(coefficients, b, tolerance=1e-12)
+            assert result.converged
+            assert result.iterations == len(result.residuals) - 1
+            assert result.residuals[-1] <= 1e-12 * sum(e * e for e in b) ** 0.5
+            assert all(abs(x - e) < 1e-9 for x, e in zip(result.x, expected))
+
+def test_callback_stops_iterations():
+    a = _poisson(12)
+    b = [1.0] * 12
+    for solver in (conjugate_gradient, jacobi, gauss_seidel):
+        calls = []
+        result = solver(a, b, tolerance=1e-14, callback=lambda iteration, x, residual: calls.append(iteration) or iteration == 2)
+        assert calls == [1, 2] and result.iterations == 2 and not result.converged
+
+def test_max_iterations_and_initial_guess():
+    a = _poisson(12)
+    b = [1.0] * 12
+    result = jacobi(a, b, tolerance=1e-14, max_iter=3)
+    assert result.iterations == 3 and not result.converged
+    exact = a.solve(b)
+    result = gauss_seidel(a, b, x0=exact)
+    assert result.converged and result.iterations == 0
+
+def test_zero_diagonal_and_wrong_arguments():
+    a = Matrix(2, 2)
+    a[0, 1] = a[1, 0] = 1.0
+    with pytest.raises(ValueError):
+        jacobi(a, [1.0, 1.0])
+    with pytest.raises(ValueError):
+        conjugate_gradient(_poisson(3), [1.0, 2.0])
+    with pytest.raises(TypeError):
+        conjugate_gradient([[1.0]], [1.0])
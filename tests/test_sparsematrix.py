@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from matrix import Matrix, WrongDimensionsException
+from sparsematrix import SparseMatrix
+from vector import Vector
+
+def _random_matrix(rnd, rows, columns, density=0.3):
+    m = Matrix(rows, columns)
+    for i in range(rows):
+        m[i] = [rnd.choice([1.0, -2.0, 0.5, 3.0]) if rnd.random() < density else 0.0 for j in range(columns)]
+    return m
+
+def test_from_coo_sums_repeated_entries():
+    s = SparseMatrix.from_coo(2, 3, [(0, 1, 2.0), (1, 2, 1.0), (0, 1, 3.0), (1, 0, 1.0), (1, 0, -1.0)])
+    assert s.nnz == 2 and s[0, 1] == 5.0 and s[1, 2] == 1.0 and s[1, 0] == 0.0
+    with pytest.raises(IndexError):
+        SparseMatrix.from_coo(2, 2, [(2, 0, 1.0)])
+
+def test_operations_match_dense():
+    rnd = random.Random(3)
+    for trial in range(20):
+        a = _random_matrix(rnd, 4, 5)
+        b = _random_matrix(rnd, 5, 3)
+        c = _random_matrix(rnd, 4, 5)
+        sa, sb, sc = SparseMatrix.from_matrix(a), SparseMatrix.from_matrix(b), SparseMatrix.from_matrix(c)
+        assert sa.to_matrix() == a
+        assert list(sa) == list(a._data)
+        assert (sa * sb).to_matrix() == a * b
+        assert sa * b == a * b
+        assert a * sb == a * b
+        assert (sa + sc).to_matrix() == a + c
+        assert (sa - sc).to_matrix() == a - c
+        assert (-sa).to_matrix() == -a
+        assert (sa * 2.5).to_matrix() == a * 2.5
+        assert sa.transposed().to_matrix() == a.transposed()
+        vec = [rnd.random() for i in range(4)]
+        assert list(sa * vec) == list(a * vec)
+        assert list(sa.row(1)) == list(a[1])
+
+def test_element_assignment_keeps_rows_sorted():
+    s = SparseMatrix(3, 3)
+    s[1, 2] = 4.0
+    s[1, 0] = 2.0
+    s[0, 1] = 1.0
+    s[1, 2] = 0.0
+    dense = Matrix(3, 3)
+    dense[1, 0] = 2.0
+    dense[0, 1] = 1.0
+    assert s.nnz == 2 and s.to_matrix() == dense
+    assert list(s._indptr) == [0, 1, 2, 2]
+
+def test_dimension_errors():
+    with pytest.raises(WrongDimensionsException):
+        SparseMatrix(2, 3) * SparseMatrix(2, 3)
+    with pytest.raises(ValueError):
+        SparseMatrix(2, 3) * Vector([1.0, 2.0, 3.0])
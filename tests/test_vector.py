@@ -0,0 +1,18 @@
+import pytest
+
+from vector import Vector2, Vector3, Vector4
+
+def test_fixed_vectors_are_immutable():
+    for v in (Vector2(1, 2), Vector3(1, 2, 3), Vector4(1, 2, 3, 4)):
+        h = hash(v)
+        with pytest.raises(AttributeError):
+            v.x = 5
+        with pytest.raises(AttributeError):
+            del v.y
+        with pytest.raises(TypeError):
+            v[0] = 5
+        assert hash(v) == h and v.x == 1
+
+def test_fixed_vector_as_dict_key():
+    d = {Vector3(1, 2, 3): "a"}
+    assert d[Vector3(1, 2, 3)] == "a"